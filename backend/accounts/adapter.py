@@ -1,7 +1,21 @@
-from urllib.parse import urlencode, urlsplit, urlunsplit
+from functools import lru_cache
+from urllib.parse import quote
 
 from allauth.account.adapter import DefaultAccountAdapter
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+@lru_cache(maxsize=1)
+def _frontend_base_url():
+    return settings.FRONTEND_BASE_URL.rstrip("/")
+
+
+@receiver(setting_changed)
+def _reset_frontend_base_url(*, setting, **kwargs):
+    if setting == "FRONTEND_BASE_URL":
+        _frontend_base_url.cache_clear()
 
 
 class CustomAccountAdapter(DefaultAccountAdapter):
@@ -9,21 +23,26 @@ class CustomAccountAdapter(DefaultAccountAdapter):
         return False
 
     def get_email_confirmation_url(self, request, emailconfirmation):
-        locale = self._get_locale(request)
-        base_url = settings.FRONTEND_BASE_URL.rstrip("/")
-        key = emailconfirmation.key
-        path = f"/{locale}/verify-email"
-        query = urlencode({"key": key, "locale": locale})
-        return f"{base_url}{path}?{query}"
+        locale = quote(self._get_locale(request), safe="")
+        key = quote(emailconfirmation.key, safe="")
+        return f"{_frontend_base_url()}/{locale}/verify-email?key={key}&locale={locale}"
 
     def _get_locale(self, request):
         if request is None:
             return settings.FRONTEND_DEFAULT_LOCALE
 
-        locale = getattr(request, "confirmation_locale", None)
-        if not locale:
-            locale = request.GET.get("locale")
-        if not locale:
-            locale = getattr(request, "LANGUAGE_CODE", None)
+        cached_locale = getattr(request, "_resolved_confirmation_locale", None)
+        if cached_locale is not None:
+            return cached_locale
 
-        return locale or settings.FRONTEND_DEFAULT_LOCALE
+        locale = (
+            getattr(request, "confirmation_locale", None)
+            or request.GET.get("locale")
+            or getattr(request, "LANGUAGE_CODE", None)
+            or settings.FRONTEND_DEFAULT_LOCALE
+        )
+        try:
+            request._resolved_confirmation_locale = locale
+        except AttributeError:
+            pass
+        return locale
@@ -27,3 +27,7 @@ class CustomUserAdmin(UserAdmin):
         "consent_given",
         "is_staff",
     )
+    list_display_links = ("username",)
+    list_filter = UserAdmin.list_filter + ("role",)
+    list_per_page = 50
+    show_full_result_count = False
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from .services import cache_auth_token, get_cached_auth_token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that keeps resolved tokens in the cache.
+
+    Only the user id and the fields permission checks read are cached; other
+    user fields load lazily. Entries are dropped when the token is deleted
+    (logout) or its user is saved, so role and activation changes take effect
+    on the next request. That only holds across Gunicorn workers with a shared
+    cache, so caching is off unless DJANGO_CACHE_URL is set.
+    """
+
+    def authenticate_credentials(self, key):
+        if settings.ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS <= 0:
+            return super().authenticate_credentials(key)
+
+        token, generation = get_cached_auth_token(key)
+        if token is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related("user").get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+            cache_auth_token(token, generation=generation)
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        return (token.user, token)
@@ -1,15 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from django.conf import settings
-from django.template.loader import render_to_string
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.template.loader import get_template
+from django.utils.autoreload import file_changed
+
+try:
+    import resend
+except ModuleNotFoundError:
+    resend = None
+
+RESEND_BULK_MAX_WORKERS = 8
 
 
 def send_resend_email(to_email, subject, html, text, attachments=None):
-    if not settings.RESEND_API_KEY:
+    api_key = settings.RESEND_API_KEY
+    if not api_key:
         return False, "missing_resend_api_key"
-    try:
-        import resend
-    except ModuleNotFoundError:
+    if resend is None:
         return False, "missing_resend_package"
-    resend.api_key = settings.RESEND_API_KEY
+    # The key is read per call so rotated or overridden settings still apply,
+    # but the SDK global is only written when it actually changes.
+    if resend.api_key != api_key:
+        resend.api_key = api_key
     payload = {
         "from": settings.RESEND_FROM_EMAIL,
         "to": [to_email],
@@ -30,21 +46,126 @@ def send_resend_email(to_email, subject, html, text, attachments=None):
     return True, ""
 
 
-def send_club_admin_welcome_email(user, club, reset_url):
+def send_bulk_resend_email(messages):
+    # Each message is a dict of send_resend_email() keyword arguments. The
+    # HTTPS round trips overlap in a small thread pool; results keep the
+    # order of the input messages.
+    messages = list(messages)
+    if len(messages) <= 1:
+        return [send_resend_email(**message) for message in messages]
+    max_workers = min(RESEND_BULK_MAX_WORKERS, len(messages))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda message: send_resend_email(**message), messages))
+
+
+@lru_cache(maxsize=8)
+def _email_template(template_name):
+    return get_template(template_name)
+
+
+@receiver(setting_changed)
+def _reset_email_templates_on_setting_change(*, setting, **kwargs):
+    if setting == "TEMPLATES":
+        _email_template.cache_clear()
+
+
+@receiver(file_changed)
+def _reset_email_templates_on_file_change(**kwargs):
+    # Django's template autoreloader resets its own loaders without
+    # restarting runserver; drop the compiled templates held here as well.
+    # Returning None leaves the restart decision to the other receivers.
+    _email_template.cache_clear()
+
+
+def _greeting_name(user):
+    return f"{user.first_name or ''} {user.last_name or ''}"
+
+
+def _club_admin_welcome_text(user, club, reset_url):
+    return (
+        f"Hello {_greeting_name(user)},\n"
+        "\n"
+        f"You have been assigned as a Club Admin for {club.name} in the LTF License Manager.\n"
+        "\n"
+        "This email was sent because you were selected as a Club Admin.\n"
+        f"Your username: {user.username or ''}\n"
+        "Please set your password using the link below:\n"
+        "\n"
+        f"{reset_url}\n"
+        "\n"
+        "If you did not expect this email, you can ignore it.\n"
+        "\n"
+        "LTF License Manager\n"
+    )
+
+
+def _password_reset_text(user, reset_url):
+    return (
+        f"Hello {_greeting_name(user)},\n"
+        "\n"
+        "We received a request to reset your LTF License Manager password.\n"
+        "\n"
+        f"Your username: {user.username or ''}\n"
+        "\n"
+        "Reset your password:\n"
+        f"{reset_url}\n"
+        "\n"
+        "If you did not request this, you can ignore this email.\n"
+        "\n"
+        "LTF License Manager\n"
+    )
+
+
+def render_club_admin_welcome_email(user, club, reset_url):
     subject = f"You are a Club Admin for {club.name}"
     context = {
         "user": user,
         "club": club,
         "reset_url": reset_url,
     }
-    html = render_to_string("account/email/club_admin_welcome.html", context)
-    text = render_to_string("account/email/club_admin_welcome.txt", context)
-    return send_resend_email(user.email, subject, html, text)
+    html = _email_template("account/email/club_admin_welcome.html").render(context)
+    text = _club_admin_welcome_text(user, club, reset_url)
+    return subject, html, text
 
 
-def send_password_reset_email(user, reset_url):
+def render_password_reset_email(user, reset_url):
     subject = "Reset your LTF License Manager password"
     context = {"user": user, "reset_url": reset_url}
-    html = render_to_string("account/email/password_reset.html", context)
-    text = render_to_string("account/email/password_reset.txt", context)
-    return send_resend_email(user.email, subject, html, text)
+    html = _email_template("account/email/password_reset.html").render(context)
+    text = _password_reset_text(user, reset_url)
+    return subject, html, text
+
+
+def send_club_admin_welcome_email(user, club, locale):
+    # Rendering, the password reset link and the Resend API call all happen in
+    # the email worker, so no reset token sits in the broker; only a missing
+    # configuration is reported synchronously to the caller.
+    if not settings.RESEND_API_KEY:
+        return False, "missing_resend_api_key"
+    from .tasks import send_club_admin_welcome_email_task
+
+    user_id, club_id = user.id, club.id
+    transaction.on_commit(
+        lambda: send_club_admin_welcome_email_task.delay(user_id, club_id, locale)
+    )
+    return True, ""
+
+
+def send_password_reset_email(email, locale):
+    # The user lookup and token generation run in the worker as well, so the
+    # request costs the same whether or not an account matches the address.
+    if not settings.RESEND_API_KEY:
+        return False, "missing_resend_api_key"
+    from .tasks import send_password_reset_email_task
+
+    transaction.on_commit(lambda: send_password_reset_email_task.delay(email, locale))
+    return True, ""
+
+
+def send_email_confirmation(email_address, locale=None):
+    # allauth renders and sends the confirmation mail synchronously; hand it to
+    # the email worker so the resend-verification request returns immediately.
+    from .tasks import send_email_confirmation_task
+
+    email_address_id = email_address.id
+    transaction.on_commit(lambda: send_email_confirmation_task.delay(email_address_id, locale))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_role'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('ltf_admin', 'LTF Admin'), ('ltf_finance', 'LTF Finance'), ('club_admin', 'Club Admin'), ('coach', 'Coach'), ('member', 'Member')], db_index=True, default='member', max_length=20),
+        ),
+    ]
@@ -1,9 +1,15 @@
+from itertools import islice
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+CONSENT_BULK_UPDATE_BATCH_SIZE = 1000
+
+
 class User(AbstractUser):
     class Roles(models.TextChoices):
         LTF_ADMIN = "ltf_admin", _("LTF Admin")
@@ -16,6 +22,7 @@ class User(AbstractUser):
         max_length=20,
         choices=Roles.choices,
         default=Roles.MEMBER,
+        db_index=True,
     )
     is_email_verified = models.BooleanField(default=False)
     consent_given = models.BooleanField(default=False)
@@ -23,6 +30,12 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Matches the UPPER(email) expression Django emits for email__iexact.
+            models.Index(Upper("email"), name="accounts_user_email_upper_idx"),
+        ]
+
     def give_consent(self):
         self.consent_given = True
         self.consent_given_at = timezone.now()
@@ -32,3 +45,31 @@ class User(AbstractUser):
         self.consent_given = False
         self.consent_given_at = None
         self.save(update_fields=["consent_given", "consent_given_at"])
+
+    @classmethod
+    def bulk_give_consent(cls, user_ids) -> int:
+        return cls._bulk_set_consent(
+            user_ids,
+            consent_given=True,
+            consent_given_at=timezone.now(),
+        )
+
+    @classmethod
+    def bulk_revoke_consent(cls, user_ids) -> int:
+        return cls._bulk_set_consent(user_ids, consent_given=False, consent_given_at=None)
+
+    @classmethod
+    def _bulk_set_consent(cls, user_ids, **consent_fields) -> int:
+        # Issues one UPDATE per batch instead of one save() per user. save()
+        # signals do not fire, so cached user payloads are cleared explicitly.
+        from .services import invalidate_user_payloads
+
+        updated = 0
+        user_ids = iter(user_ids)
+        while batch := list(islice(user_ids, CONSENT_BULK_UPDATE_BATCH_SIZE)):
+            updated += cls.objects.filter(pk__in=batch).update(
+                **consent_fields,
+                updated_at=timezone.now(),
+            )
+            invalidate_user_payloads(*batch)
+        return updated
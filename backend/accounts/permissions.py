@@ -2,31 +2,37 @@
 from rest_framework.permissions import BasePermission
 
 
-class IsLtfAdmin(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == "ltf_admin"
+class RolePermission(BasePermission):
+    allowed_roles: frozenset[str] = frozenset()
 
-
-class IsLtfFinance(BasePermission):
     def has_permission(self, request, view) -> bool:  # type: ignore
-        return request.user.is_authenticated and request.user.role == "ltf_finance"
-
-
-class IsLtfFinanceOrLtfAdmin(BasePermission):
-    def has_permission(self, request, view) -> bool:  # type: ignore
-        return request.user.is_authenticated and request.user.role in ["ltf_finance", "ltf_admin"]
-
-
-class IsClubAdminOrCoach(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role in ["club_admin", "coach"]
-
-
-class IsClubAdmin(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role == "club_admin"
-
-
-class IsLtfAdminOrClubAdmin(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.role in ["ltf_admin", "club_admin"]
+        # Results are memoized per request so composed or repeated checks of
+        # the same permission class do not re-resolve the user and its role.
+        cache = getattr(request, "_role_permission_cache", None)
+        if cache is None:
+            cache = {}
+            request._role_permission_cache = cache
+        key = type(self)
+        if key not in cache:
+            cache[key] = self.check_role(request, view)
+        return cache[key]
+
+    def check_role(self, request, view) -> bool:
+        user = request.user
+        return bool(user.is_authenticated and user.role in self.allowed_roles)
+
+
+def role_permission(name: str, *roles: str) -> type[RolePermission]:
+    return type(
+        name,
+        (RolePermission,),
+        {"allowed_roles": frozenset(roles), "__module__": __name__},
+    )
+
+
+IsLtfAdmin = role_permission("IsLtfAdmin", "ltf_admin")
+IsLtfFinance = role_permission("IsLtfFinance", "ltf_finance")
+IsLtfFinanceOrLtfAdmin = role_permission("IsLtfFinanceOrLtfAdmin", "ltf_finance", "ltf_admin")
+IsClubAdminOrCoach = role_permission("IsClubAdminOrCoach", "club_admin", "coach")
+IsClubAdmin = role_permission("IsClubAdmin", "club_admin")
+IsLtfAdminOrClubAdmin = role_permission("IsLtfAdminOrClubAdmin", "ltf_admin", "club_admin")
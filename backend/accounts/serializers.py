@@ -90,11 +90,12 @@ class LoginSerializer(serializers.Serializer):
         )
         if not user:
             raise serializers.ValidationError("Invalid credentials")
-        is_verified = user.is_email_verified or EmailAddress.objects.filter(
-            user=user, verified=True
-        ).exists()
-        if not is_verified:
-            raise serializers.ValidationError("Email address not verified")
+        if not user.is_email_verified:
+            if not EmailAddress.objects.filter(user=user, verified=True).exists():
+                raise serializers.ValidationError("Email address not verified")
+            # Persist the flag so later logins skip the EmailAddress lookup.
+            user.is_email_verified = True
+            user.save(update_fields=["is_email_verified"])
         attrs["user"] = user
         return attrs
 
@@ -0,0 +1,152 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+
+from .models import User
+
+# User fields kept in the token authentication cache.
+AUTH_USER_CACHE_FIELDS = ("id", "role", "is_active", "is_staff", "is_superuser")
+
+# Formats consent_given_at exactly like UserSerializer's DateTimeField would.
+_datetime_field = serializers.DateTimeField()
+
+
+def _auth_token_digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _auth_token_cache_key(key: str) -> str:
+    return f"accounts:auth_token:v3:{_auth_token_digest(key)}"
+
+
+def _auth_user_cache_key(user_id: int, generation: str) -> str:
+    return f"accounts:auth_user:v2:{int(user_id)}:{generation}"
+
+
+def _user_payload_cache_key(user_id: int) -> str:
+    return f"accounts:user_payload:v1:{int(user_id)}"
+
+
+def build_user_payload(user) -> dict:
+    # Hand-rolled equivalent of UserSerializer(user).data; the fields are fixed,
+    # so skip DRF's per-field to_representation walk. Kept in sync by a test.
+    consent_given_at = user.consent_given_at
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "role": user.role,
+        "is_email_verified": user.is_email_verified,
+        "consent_given": user.consent_given,
+        "consent_given_at": (
+            _datetime_field.to_representation(consent_given_at)
+            if consent_given_at is not None
+            else None
+        ),
+    }
+
+
+def _with_payload_fields(user):
+    # Users from the token cache only carry the auth fields; load the row once
+    # rather than one query per deferred field.
+    if user.get_deferred_fields():
+        return User.objects.get(pk=user.pk)
+    return user
+
+
+def get_user_payload(user) -> dict:
+    if settings.ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS <= 0:
+        return build_user_payload(_with_payload_fields(user))
+    cache_key = _user_payload_cache_key(user.pk)
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = build_user_payload(_with_payload_fields(user))
+        cache.set(
+            cache_key,
+            payload,
+            timeout=settings.ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS,
+        )
+    return payload
+
+
+def invalidate_user_payloads(*user_ids: int) -> None:
+    if user_ids:
+        cache.delete_many([_user_payload_cache_key(user_id) for user_id in user_ids])
+
+
+def _auth_user_generation_key(user_id: int) -> str:
+    return f"accounts:auth_user_generation:v1:{int(user_id)}"
+
+
+def get_cached_auth_token(key: str):
+    """Return ``(token, generation)`` for a token key from the cache.
+
+    ``token`` is None on a miss. ``generation`` is the user's cache generation
+    seen before any database read, or None when the token's user id is not
+    cached either; pass it on to ``cache_auth_token``.
+    """
+    user_id = cache.get(_auth_token_cache_key(key))
+    if user_id is None:
+        return None, None
+    generation = cache.get(_auth_user_generation_key(user_id), "")
+    user_fields = cache.get(_auth_user_cache_key(user_id, generation))
+    # A user has at most one token; the digest guards against an entry
+    # written for a token that has since been replaced.
+    if user_fields is None or user_fields.pop("token", None) != _auth_token_digest(key):
+        return None, generation
+    # Rebuild the objects as if loaded with .only(): any other field is fetched
+    # on first access, and save() only writes the fields present here. from_db
+    # expects the values in model field order.
+    field_names = [
+        field.attname for field in User._meta.concrete_fields if field.attname in user_fields
+    ]
+    user = User.from_db(
+        User.objects.db, field_names, [user_fields[name] for name in field_names]
+    )
+    token = Token.from_db(Token.objects.db, ["key", "user_id"], [key, user_id])
+    token.user = user
+    return token, generation
+
+
+def cache_auth_token(token, *, generation: str | None = None) -> None:
+    # Only the token -> user id mapping and the few user fields that
+    # authentication and permission checks read are cached; never the password
+    # hash or profile data.
+    #
+    # The user entry is keyed on the generation read *before* the token was
+    # loaded from the database. If the user is saved in between, the
+    # generation moves on and the stale entry written here is never read.
+    # Without a generation (the token id was not cached yet) only the
+    # mapping is stored, and the next request caches the user fields.
+    user = token.user
+    timeout = settings.ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS
+    entries = {_auth_token_cache_key(token.key): user.pk}
+    if generation is not None:
+        user_fields = {
+            field_name: getattr(user, field_name) for field_name in AUTH_USER_CACHE_FIELDS
+        }
+        user_fields["token"] = _auth_token_digest(token.key)
+        entries[_auth_user_cache_key(user.pk, generation)] = user_fields
+    cache.set_many(entries, timeout=timeout)
+
+
+def invalidate_auth_tokens(*keys: str) -> None:
+    if keys:
+        cache.delete_many([_auth_token_cache_key(key) for key in keys])
+
+
+def invalidate_auth_users(*user_ids: int) -> None:
+    # Moving to a new generation orphans every user entry written under the
+    # old one, including entries a concurrent request is about to write from
+    # data it read before the change.
+    if user_ids:
+        cache.set_many(
+            {_auth_user_generation_key(user_id): uuid.uuid4().hex for user_id in user_ids},
+            timeout=None,
+        )
@@ -1,6 +1,13 @@
 from allauth.account.signals import email_confirmed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from rest_framework.authtoken.models import Token
+
+from .models import User
+from .services import invalidate_auth_tokens, invalidate_auth_users, invalidate_user_payloads
+
 
 @receiver(email_confirmed)
 def mark_user_email_verified(request, email_address, **kwargs):
@@ -8,3 +15,28 @@ def mark_user_email_verified(request, email_address, **kwargs):
     if not user.is_email_verified:
         user.is_email_verified = True
         user.save(update_fields=["is_email_verified"])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_payload(sender, instance, **kwargs):
+    invalidate_user_payloads(instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_auth_user(sender, instance, **kwargs):
+    _invalidate_auth_user(instance.pk)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_cached_auth_token(sender, instance, **kwargs):
+    invalidate_auth_tokens(instance.key)
+    _invalidate_auth_user(instance.user_id)
+
+
+def _invalidate_auth_user(user_id):
+    # Invalidate again after commit: until then, a concurrent request still
+    # reads the old row and could cache it under the new generation.
+    invalidate_auth_users(user_id)
+    transaction.on_commit(lambda: invalidate_auth_users(user_id))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from allauth.account.models import EmailAddress
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.http import HttpRequest
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from clubs.models import Club
+
+from .email_utils import (
+    render_club_admin_welcome_email,
+    render_password_reset_email,
+    send_resend_email,
+)
+from .models import User
+
+
+EMAIL_RETRY_BASE_SECONDS = 30
+EMAIL_RETRY_MAX_SECONDS = 600
+NON_RETRYABLE_EMAIL_ERRORS = frozenset({"missing_resend_api_key", "missing_resend_package"})
+
+
+def _email_retry_countdown(retries: int) -> int:
+    return min(EMAIL_RETRY_MAX_SECONDS, EMAIL_RETRY_BASE_SECONDS * (2**retries))
+
+
+def _password_reset_url(user, locale: str) -> str:
+    # Built in the worker so the reset token never travels through the broker.
+    token = default_token_generator.make_token(user)
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    return f"{settings.FRONTEND_BASE_URL}/{locale}/reset-password?uid={uid}&token={token}"
+
+
+def _deliver_or_retry(task, to_email: str, subject: str, html: str, text: str) -> None:
+    success, error = send_resend_email(to_email, subject, html, text)
+    if success or error in NON_RETRYABLE_EMAIL_ERRORS:
+        return
+    raise task.retry(
+        exc=RuntimeError(error or "email_send_failed"),
+        countdown=_email_retry_countdown(task.request.retries),
+    )
+
+
+@shared_task(
+    bind=True,
+    max_retries=getattr(settings, "CELERY_EMAIL_TASK_MAX_RETRIES", 5),
+)
+def send_club_admin_welcome_email_task(self, user_id: int, club_id: int, locale: str) -> None:
+    user = User.objects.filter(id=user_id).first()
+    club = Club.objects.filter(id=club_id).first()
+    if user is None or club is None or not user.email:
+        return
+    reset_url = _password_reset_url(user, locale)
+    subject, html, text = render_club_admin_welcome_email(user, club, reset_url)
+    _deliver_or_retry(self, user.email, subject, html, text)
+
+
+@shared_task(
+    bind=True,
+    max_retries=getattr(settings, "CELERY_EMAIL_TASK_MAX_RETRIES", 5),
+)
+def send_password_reset_email_task(self, email: str, locale: str) -> None:
+    user = User.objects.filter(email__iexact=email, is_active=True).first()
+    if user is None or not user.email:
+        return
+    reset_url = _password_reset_url(user, locale)
+    subject, html, text = render_password_reset_email(user, reset_url)
+    _deliver_or_retry(self, user.email, subject, html, text)
+
+
+@shared_task(
+    bind=True,
+    max_retries=getattr(settings, "CELERY_EMAIL_TASK_MAX_RETRIES", 5),
+)
+def send_email_confirmation_task(
+    self, email_address_id: int, locale: str | None = None
+) -> None:
+    email_address = (
+        EmailAddress.objects.select_related("user").filter(id=email_address_id).first()
+    )
+    if email_address is None or email_address.verified:
+        return
+    # The account adapter reads the locale from the request when building the
+    # confirmation URL; site lookups fall back to SITE_ID.
+    request = HttpRequest()
+    request.confirmation_locale = locale
+    try:
+        email_address.send_confirmation(request)
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=_email_retry_countdown(self.request.retries))
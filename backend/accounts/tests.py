@@ -1,14 +1,27 @@
+from functools import lru_cache
 from io import BytesIO
+from pathlib import Path
 import shutil
 import tempfile
+from unittest.mock import patch
 
 from allauth.account.models import EmailAddress, EmailConfirmationHMAC
-from django.test import TestCase
+from celery.exceptions import Retry
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.template import Context, Engine
+from django.test import SimpleTestCase, TestCase
 from django.test import override_settings
 from django.utils import timezone
+from django.utils.autoreload import file_changed
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIRequestFactory
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
+from rest_framework.throttling import ScopedRateThrottle
 from PIL import Image
 
 from clubs.models import Club
@@ -16,8 +29,35 @@ from licenses.models import License, LicenseHistoryEvent, LicenseType
 from members.models import GradePromotionHistory, Member
 from members.services import process_member_profile_picture
 from .adapter import CustomAccountAdapter
+from .email_utils import (
+    _email_template,
+    render_club_admin_welcome_email,
+    render_password_reset_email,
+    send_bulk_resend_email,
+    send_resend_email,
+)
 from .models import User
 from .permissions import IsLtfFinance, IsLtfFinanceOrLtfAdmin
+from .serializers import UserSerializer
+from .services import (
+    build_user_payload,
+    cache_auth_token,
+    get_cached_auth_token,
+    invalidate_user_payloads,
+)
+from .tasks import (
+    send_club_admin_welcome_email_task,
+    send_email_confirmation_task,
+    send_password_reset_email_task,
+)
+
+
+@lru_cache(maxsize=None)
+def _encoded_test_image(width: int, height: int, image_format: str) -> bytes:
+    image = Image.new("RGB", (width, height), color=(210, 210, 210))
+    payload = BytesIO()
+    image.save(payload, format=image_format)
+    return payload.getvalue()
 
 
 class UserModelTests(TestCase):
@@ -39,37 +79,67 @@ class UserModelTests(TestCase):
         self.assertFalse(user.consent_given)
         self.assertIsNone(user.consent_given_at)
 
+    def test_bulk_give_and_revoke_consent(self):
+        first = User.objects.create_user(username="bulkone", password="pass12345")
+        second = User.objects.create_user(username="bulktwo", password="pass12345")
+        untouched = User.objects.create_user(username="bulkthree", password="pass12345")
+
+        self.assertEqual(User.bulk_give_consent([first.id, second.id]), 2)
+        self.assertEqual(
+            set(User.objects.filter(consent_given=True).values_list("id", flat=True)),
+            {first.id, second.id},
+        )
+        self.assertFalse(
+            User.objects.filter(consent_given=True, consent_given_at__isnull=True).exists()
+        )
+
+        self.assertEqual(User.bulk_revoke_consent(iter([first.id])), 1)
+        first.refresh_from_db()
+        untouched.refresh_from_db()
+        self.assertFalse(first.consent_given)
+        self.assertIsNone(first.consent_given_at)
+        self.assertFalse(untouched.consent_given)
+
 
 class AuthApiTests(TestCase):
-    def setUp(self):
-        self.media_root = tempfile.mkdtemp()
-        self.media_override = override_settings(MEDIA_ROOT=self.media_root)
-        self.media_override.enable()
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="verifyme",
             email="verify@example.com",
             password="pass12345",
         )
-        self.admin = User.objects.create_user(
+        cls.admin = User.objects.create_user(
             username="adminhistory",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
-        self.club = Club.objects.create(name="Export Club", created_by=self.admin)
-        self.member = Member.objects.create(
-            user=self.user,
-            club=self.club,
+        cls.club = Club.objects.create(name="Export Club", created_by=cls.admin)
+        cls.member = Member.objects.create(
+            user=cls.user,
+            club=cls.club,
             first_name="Mia",
             last_name="Stone",
             belt_rank="4th Kup",
         )
 
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_override.enable()
+        self.client = APIClient()
+        cache.clear()
+
     def tearDown(self):
         self.media_override.disable()
         shutil.rmtree(self.media_root, ignore_errors=True)
         super().tearDown()
 
+    def _create_email_address(self, *, verified=False):
+        return EmailAddress.objects.create(
+            user=self.user, email=self.user.email, verified=verified, primary=True
+        )
+
     def _make_test_image(
         self,
         name: str,
@@ -78,12 +148,12 @@ class AuthApiTests(TestCase):
         height: int = 1800,
         image_format: str = "JPEG",
     ) -> SimpleUploadedFile:
-        image = Image.new("RGB", (width, height), color=(210, 210, 210))
-        payload = BytesIO()
-        image.save(payload, format=image_format)
-        payload.seek(0)
         content_type = "image/png" if image_format.upper() == "PNG" else "image/jpeg"
-        return SimpleUploadedFile(name, payload.getvalue(), content_type=content_type)
+        return SimpleUploadedFile(
+            name,
+            _encoded_test_image(width, height, image_format),
+            content_type=content_type,
+        )
 
     def test_login_requires_verified_email(self):
         response = self.client.post(
@@ -108,9 +178,7 @@ class AuthApiTests(TestCase):
         self.assertEqual(response.status_code, 404)
 
     def test_login_succeeds_with_verified_email(self):
-        EmailAddress.objects.create(
-            user=self.user, email=self.user.email, verified=True, primary=True
-        )
+        self._create_email_address(verified=True)
         response = self.client.post(
             "/api/auth/login/",
             {"username": "verifyme", "password": "pass12345"},
@@ -118,11 +186,11 @@ class AuthApiTests(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertIn("token", response.data)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_email_verified)
 
     def test_resend_verification(self):
-        EmailAddress.objects.create(
-            user=self.user, email=self.user.email, verified=False, primary=True
-        )
+        self._create_email_address()
         response = self.client.post(
             "/api/auth/resend-verification/",
             {"email": self.user.email},
@@ -130,10 +198,53 @@ class AuthApiTests(TestCase):
         )
         self.assertEqual(response.status_code, 200)
 
-    def test_verify_email_with_key(self):
-        email_address = EmailAddress.objects.create(
-            user=self.user, email=self.user.email, verified=False, primary=True
+    def test_resend_verification_matches_email_case_insensitively(self):
+        self._create_email_address()
+        with patch("accounts.tasks.send_email_confirmation_task.delay") as delay_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    "/api/auth/resend-verification/",
+                    {"email": self.user.email.upper(), "locale": "lb"},
+                    format="json",
+                )
+        self.assertEqual(response.status_code, 200)
+        delay_mock.assert_called_once_with(
+            EmailAddress.objects.get(user=self.user).id, "lb"
         )
+
+    def test_email_confirmation_task_sends_localized_link(self):
+        email_address = self._create_email_address()
+        send_email_confirmation_task.apply(args=(email_address.id, "lb"))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("/lb/verify-email?key=", mail.outbox[0].body)
+
+    def test_email_confirmation_task_retries_failed_send(self):
+        email_address = self._create_email_address()
+        with patch.object(
+            EmailAddress, "send_confirmation", side_effect=OSError("smtp down")
+        ), patch.object(
+            send_email_confirmation_task, "retry", side_effect=Retry()
+        ) as retry_mock:
+            with self.assertRaises(Retry):
+                send_email_confirmation_task.run(email_address.id, "lb")
+        self.assertIsInstance(retry_mock.call_args.kwargs["exc"], OSError)
+        self.assertEqual(retry_mock.call_args.kwargs["countdown"], 30)
+
+    def test_resend_verification_is_throttled_per_scope(self):
+        rates = {**ScopedRateThrottle.THROTTLE_RATES, "email_verification": "2/minute"}
+        with patch.object(ScopedRateThrottle, "THROTTLE_RATES", rates):
+            statuses = [
+                self.client.post(
+                    "/api/auth/resend-verification/",
+                    {"email": "nobody@example.com"},
+                    format="json",
+                ).status_code
+                for _ in range(3)
+            ]
+        self.assertEqual(statuses, [200, 200, 429])
+
+    def test_verify_email_with_key(self):
+        email_address = self._create_email_address()
         key = EmailConfirmationHMAC(email_address).key
         response = self.client.post(
             "/api/auth/verify-email/",
@@ -144,6 +255,236 @@ class AuthApiTests(TestCase):
         email_address.refresh_from_db()
         self.assertTrue(email_address.verified)
 
+    def test_verify_email_rejects_malformed_key_without_lookup(self):
+        with patch("accounts.views.EmailConfirmationHMAC.from_key") as from_key_mock:
+            for key in ("short", "x" * 600, "not a valid key with spaces!"):
+                response = self.client.post(
+                    "/api/auth/verify-email/", {"key": key}, format="json"
+                )
+                self.assertEqual(response.status_code, 400)
+        from_key_mock.assert_not_called()
+
+    def test_verify_email_retry_skips_key_lookup(self):
+        email_address = self._create_email_address()
+        key = EmailConfirmationHMAC(email_address).key
+        first = self.client.post("/api/auth/verify-email/", {"key": key}, format="json")
+        self.assertEqual(first.status_code, 200)
+
+        with patch("accounts.views.EmailConfirmationHMAC.from_key") as from_key_mock:
+            with self.assertNumQueries(0):
+                retry = self.client.post("/api/auth/verify-email/", {"key": key}, format="json")
+        self.assertEqual(retry.status_code, 200)
+        from_key_mock.assert_not_called()
+
+    def _warm_token_cache(self, token):
+        # The first request caches the token's user id, the second the user's
+        # auth fields under the generation it read before the lookup.
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        for _ in range(2):
+            self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+
+    @override_settings(
+        ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=300,
+        ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS=60,
+    )
+    def test_token_auth_is_cached_until_logout(self):
+        token = Token.objects.create(user=self.user)
+        self._warm_token_cache(token)
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.post("/api/auth/logout/").status_code, 204)
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 403)
+
+    @override_settings(ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=300)
+    def test_cached_token_reflects_user_changes(self):
+        token = Token.objects.create(user=self.user)
+        self._warm_token_cache(token)
+
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 403)
+
+    @override_settings(ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=300)
+    def test_cached_token_ignores_entry_written_from_stale_read(self):
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+
+        # A request reads the generation and the token row, then the user is
+        # deactivated before that request writes the cache entry.
+        _, generation = get_cached_auth_token(token.key)
+        stale_token = Token.objects.select_related("user").get(key=token.key)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        cache_auth_token(stale_token, generation=generation)
+
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 403)
+
+    @override_settings(ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=0)
+    def test_token_auth_cache_can_be_disabled(self):
+        token = Token.objects.create(user=self.user)
+        self._warm_token_cache(token)
+        self.assertEqual(get_cached_auth_token(token.key), (None, None))
+
+    @override_settings(ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=300)
+    def test_cached_token_keeps_only_auth_fields(self):
+        token = Token.objects.create(user=self.user)
+        self._warm_token_cache(token)
+
+        cached_user = get_cached_auth_token(token.key)[0].user
+        self.assertEqual(cached_user.pk, self.user.pk)
+        self.assertEqual(cached_user.role, self.user.role)
+        self.assertIn("password", cached_user.get_deferred_fields())
+        self.assertIn("email", cached_user.get_deferred_fields())
+
+    @override_settings(
+        ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS=300,
+        ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS=60,
+    )
+    def test_me_with_cached_token_loads_user_row_once(self):
+        token = Token.objects.create(user=self.user)
+        self._warm_token_cache(token)
+        invalidate_user_payloads(self.user.pk)
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, build_user_payload(self.user))
+
+    def test_user_save_invalidates_cached_token_without_token_query(self):
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=["first_name"])
+
+    @override_settings(ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS=60)
+    def test_me_payload_is_cached_and_invalidated_on_save(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data["consent_given"])
+
+        with patch("accounts.services.build_user_payload") as build_mock:
+            cached_response = self.client.get("/api/auth/me/")
+        build_mock.assert_not_called()
+        self.assertEqual(cached_response.data, response.data)
+
+        self.user.give_consent()
+        response = self.client.get("/api/auth/me/")
+        self.assertTrue(response.data["consent_given"])
+
+    @override_settings(ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS=0)
+    def test_me_payload_cache_can_be_disabled(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+        with patch(
+            "accounts.services.build_user_payload", wraps=build_user_payload
+        ) as build_mock:
+            self.assertEqual(self.client.get("/api/auth/me/").status_code, 200)
+        build_mock.assert_called_once()
+
+    def test_user_payload_matches_user_serializer(self):
+        self.assertEqual(build_user_payload(self.user), dict(UserSerializer(self.user).data))
+        self.user.give_consent()
+        self.assertEqual(build_user_payload(self.user), dict(UserSerializer(self.user).data))
+
+    def test_me_response_is_not_browser_cached_by_default(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("max-age", response.get("Cache-Control", ""))
+
+    @override_settings(ACCOUNT_ME_BROWSER_CACHE_MAX_AGE_SECONDS=30)
+    def test_me_response_is_privately_cacheable(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=30", response["Cache-Control"])
+        self.assertIn("Authorization", response["Vary"])
+
+    @override_settings(ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS=60)
+    def test_consent_response_refreshes_cached_user_payload(self):
+        self.client.force_authenticate(user=self.user)
+        self.assertFalse(self.client.get("/api/auth/me/").data["consent_given"])
+        response = self.client.post("/api/auth/consent/", {"consent_given": True}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["consent_given"])
+        self.assertTrue(self.client.get("/api/auth/me/").data["consent_given"])
+
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_password_reset_request_enqueues_email_after_commit(self):
+        with patch("accounts.tasks.send_password_reset_email_task.delay") as delay_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    "/api/auth/password-reset/",
+                    {"email": self.user.email},
+                    format="json",
+                )
+        self.assertEqual(response.status_code, 200)
+        delay_mock.assert_called_once_with(self.user.email, "en")
+
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_password_reset_request_enqueues_without_user_lookup(self):
+        with patch("accounts.tasks.send_password_reset_email_task.delay") as delay_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertNumQueries(0):
+                    response = self.client.post(
+                        "/api/auth/password-reset/",
+                        {"email": "nobody@example.com", "locale": "lb"},
+                        format="json",
+                    )
+        self.assertEqual(response.status_code, 200)
+        delay_mock.assert_called_once_with("nobody@example.com", "lb")
+
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_password_reset_email_task_renders_and_sends(self):
+        with patch(
+            "accounts.tasks.default_token_generator.make_token", return_value="tok"
+        ), patch("accounts.tasks.send_resend_email", return_value=(True, "")) as send_mock:
+            send_password_reset_email_task.apply(args=(self.user.email.upper(), "en"))
+        send_mock.assert_called_once()
+        to_email, subject, html, text = send_mock.call_args.args
+        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
+        self.assertEqual(to_email, self.user.email)
+        self.assertIn(f"reset-password?uid={uid}&amp;token=tok", html)
+        self.assertEqual(
+            text,
+            "Hello  ,\n\n"
+            "We received a request to reset your LTF License Manager password.\n\n"
+            "Your username: verifyme\n\n"
+            "Reset your password:\n"
+            f"http://localhost:3000/en/reset-password?uid={uid}&token=tok\n\n"
+            "If you did not request this, you can ignore this email.\n\n"
+            "LTF License Manager\n",
+        )
+
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_club_admin_welcome_email_task_builds_reset_link(self):
+        with patch(
+            "accounts.tasks.default_token_generator.make_token", return_value="tok"
+        ), patch("accounts.tasks.send_resend_email", return_value=(True, "")) as send_mock:
+            send_club_admin_welcome_email_task.apply(args=(self.user.pk, self.club.pk, "lb"))
+        send_mock.assert_called_once()
+        to_email, _, html, text = send_mock.call_args.args
+        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
+        self.assertEqual(to_email, self.user.email)
+        self.assertIn(f"/lb/reset-password?uid={uid}&amp;token=tok", html)
+        self.assertIn(f"http://localhost:3000/lb/reset-password?uid={uid}&token=tok\n", text)
+
+    def test_password_reset_confirm_rejects_inactive_user_without_token_check(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
+        with patch("accounts.views.default_token_generator.check_token") as check_mock:
+            response = self.client.post(
+                "/api/auth/password-reset/confirm/",
+                {"uid": uid, "token": "any-token", "password": "NewPass12345!"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 400)
+        check_mock.assert_not_called()
+
     def test_data_export_contains_history_payloads(self):
         license_type = LicenseType.objects.create(
             name="Export Annual",
@@ -185,9 +526,60 @@ class AuthApiTests(TestCase):
         self.assertIn("grade_history", response.data)
         self.assertIn("profile_photo", response.data)
         self.assertTrue(response.data["profile_photo"]["has_profile_picture"])
+        self.assertTrue(
+            response.data["profile_photo"]["processed_url"].startswith("http://testserver/")
+        )
+        self.assertEqual(
+            response.data["profile_photo"]["download_url"],
+            f"http://testserver/api/members/{self.member.id}/profile-picture/download/",
+        )
         self.assertEqual(len(response.data["license_history"]), 1)
         self.assertEqual(len(response.data["grade_history"]), 1)
 
+    def test_data_export_query_count_is_independent_of_history_size(self):
+        license_type = LicenseType.objects.create(name="Export Bulk", code="export-bulk")
+        for year in (2024, 2025, 2026):
+            license_record = License.objects.create(
+                member=self.member,
+                club=self.club,
+                license_type=license_type,
+                year=year,
+            )
+            LicenseHistoryEvent.objects.create(
+                member=self.member,
+                license=license_record,
+                club=self.club,
+                event_type=LicenseHistoryEvent.EventType.ISSUED,
+                license_year=year,
+                status_after=license_record.status,
+                club_name_snapshot=self.club.name,
+            )
+        self.client.force_authenticate(user=self.user)
+        # Member, licenses, license history and grade history.
+        with self.assertNumQueries(4):
+            response = self.client.get("/api/auth/data-export/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["licenses"]), 3)
+        self.assertEqual(len(response.data["license_history"]), 3)
+        self.assertEqual(
+            {row["year"] for row in response.data["licenses"]}, {2024, 2025, 2026}
+        )
+        self.assertEqual(
+            set(response.data["licenses"][0]),
+            {"id", "year", "status", "start_date", "end_date"},
+        )
+
+    def test_data_export_without_member_skips_history_queries(self):
+        self.client.force_authenticate(user=self.admin)
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/auth/data-export/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["member"])
+        self.assertIsNone(response.data["profile_photo"])
+        self.assertEqual(response.data["licenses"], [])
+        self.assertEqual(response.data["license_history"], [])
+        self.assertEqual(response.data["grade_history"], [])
+
     def test_data_delete_anonymizes_grade_history_notes(self):
         self.user.give_consent()
         process_member_profile_picture(
@@ -219,7 +611,173 @@ class AuthApiTests(TestCase):
         self.assertFalse(self.member.profile_picture_thumbnail)
 
 
+class EmailTextBodyTests(SimpleTestCase):
+    # Plain-text templates these bodies replaced; rendered with autoescaping off,
+    # since escaping the URL was the one intended change.
+    LEGACY_CLUB_ADMIN_WELCOME_TXT = (
+        'Hello {{ user.first_name|default:"" }} {{ user.last_name|default:"" }},\n\n'
+        "You have been assigned as a Club Admin for {{ club.name }} in the LTF License Manager.\n\n"
+        "This email was sent because you were selected as a Club Admin.\n"
+        'Your username: {{ user.username|default:"" }}\n'
+        "Please set your password using the link below:\n\n"
+        "{{ reset_url }}\n\n"
+        "If you did not expect this email, you can ignore it.\n\n"
+        "LTF License Manager\n"
+    )
+    LEGACY_PASSWORD_RESET_TXT = (
+        'Hello {{ user.first_name|default:"" }} {{ user.last_name|default:"" }},\n\n'
+        "We received a request to reset your LTF License Manager password.\n\n"
+        'Your username: {{ user.username|default:"" }}\n\n'
+        "Reset your password:\n"
+        "{{ reset_url }}\n\n"
+        "If you did not request this, you can ignore this email.\n\n"
+        "LTF License Manager\n"
+    )
+
+    def setUp(self):
+        self.user = User(username="lina.muller", first_name="Lina", last_name="Muller")
+        self.club = Club(name="Dojang Esch")
+
+    def _reset_url(self, locale):
+        return f"http://localhost:3000/{locale}/reset-password?uid=MQ&token=abc-123"
+
+    def _render_legacy(self, source, **context):
+        template = Engine().from_string(f"{{% autoescape off %}}{source}{{% endautoescape %}}")
+        return template.render(Context(context))
+
+    def test_club_admin_welcome_text(self):
+        for locale in ("en", "lb"):
+            with self.subTest(locale=locale):
+                reset_url = self._reset_url(locale)
+                _, _, text = render_club_admin_welcome_email(self.user, self.club, reset_url)
+                self.assertEqual(
+                    text,
+                    "Hello Lina Muller,\n\n"
+                    "You have been assigned as a Club Admin for Dojang Esch in the "
+                    "LTF License Manager.\n\n"
+                    "This email was sent because you were selected as a Club Admin.\n"
+                    "Your username: lina.muller\n"
+                    "Please set your password using the link below:\n\n"
+                    f"http://localhost:3000/{locale}/reset-password?uid=MQ&token=abc-123\n\n"
+                    "If you did not expect this email, you can ignore it.\n\n"
+                    "LTF License Manager\n",
+                )
+                self.assertEqual(
+                    text,
+                    self._render_legacy(
+                        self.LEGACY_CLUB_ADMIN_WELCOME_TXT,
+                        user=self.user,
+                        club=self.club,
+                        reset_url=reset_url,
+                    ),
+                )
+
+    def test_password_reset_text(self):
+        for locale in ("en", "lb"):
+            with self.subTest(locale=locale):
+                reset_url = self._reset_url(locale)
+                _, _, text = render_password_reset_email(self.user, reset_url)
+                self.assertEqual(
+                    text,
+                    "Hello Lina Muller,\n\n"
+                    "We received a request to reset your LTF License Manager password.\n\n"
+                    "Your username: lina.muller\n\n"
+                    "Reset your password:\n"
+                    f"http://localhost:3000/{locale}/reset-password?uid=MQ&token=abc-123\n\n"
+                    "If you did not request this, you can ignore this email.\n\n"
+                    "LTF License Manager\n",
+                )
+                self.assertEqual(
+                    text,
+                    self._render_legacy(
+                        self.LEGACY_PASSWORD_RESET_TXT, user=self.user, reset_url=reset_url
+                    ),
+                )
+
+    def test_text_matches_legacy_template_without_names(self):
+        user = User(username="")
+        reset_url = self._reset_url("en")
+        _, _, welcome_text = render_club_admin_welcome_email(user, self.club, reset_url)
+        _, _, reset_text = render_password_reset_email(user, reset_url)
+        self.assertEqual(
+            welcome_text,
+            self._render_legacy(
+                self.LEGACY_CLUB_ADMIN_WELCOME_TXT, user=user, club=self.club, reset_url=reset_url
+            ),
+        )
+        self.assertEqual(
+            reset_text,
+            self._render_legacy(self.LEGACY_PASSWORD_RESET_TXT, user=user, reset_url=reset_url),
+        )
+
+    def test_compiled_templates_are_dropped_when_templates_change(self):
+        _email_template("account/email/password_reset.html")
+        file_changed.send(sender=None, file_path=Path("password_reset.html"))
+        self.assertEqual(_email_template.cache_info().currsize, 0)
+
+        _email_template("account/email/password_reset.html")
+        with override_settings(TEMPLATES=settings.TEMPLATES):
+            self.assertEqual(_email_template.cache_info().currsize, 0)
+
+
+class ResendEmailTests(TestCase):
+    def test_missing_api_key_is_reported(self):
+        with override_settings(RESEND_API_KEY=""):
+            self.assertEqual(
+                send_resend_email("to@example.com", "Subject", "<p>Hi</p>", "Hi"),
+                (False, "missing_resend_api_key"),
+            )
+
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_missing_resend_package_is_reported(self):
+        with patch("accounts.email_utils.resend", None):
+            self.assertEqual(
+                send_resend_email("to@example.com", "Subject", "<p>Hi</p>", "Hi"),
+                (False, "missing_resend_package"),
+            )
+
+    @override_settings(RESEND_API_KEY="test-key", RESEND_FROM_EMAIL="from@example.com")
+    def test_send_uses_current_api_key(self):
+        with patch("accounts.email_utils.resend") as resend_mock:
+            resend_mock.api_key = None
+            result = send_resend_email("to@example.com", "Subject", "<p>Hi</p>", "Hi")
+        self.assertEqual(result, (True, ""))
+        self.assertEqual(resend_mock.api_key, "test-key")
+        payload = resend_mock.Emails.send.call_args.args[0]
+        self.assertEqual(payload["from"], "from@example.com")
+        self.assertEqual(payload["to"], ["to@example.com"])
+
+    def test_bulk_send_preserves_message_order(self):
+        def fake_send(to_email, subject, html, text, attachments=None):
+            if to_email == "fail@example.com":
+                return False, "boom"
+            return True, ""
+
+        messages = [
+            {"to_email": email, "subject": "Subject", "html": "<p>Hi</p>", "text": "Hi"}
+            for email in ["a@example.com", "fail@example.com", "c@example.com"]
+        ]
+        with patch("accounts.email_utils.send_resend_email", side_effect=fake_send):
+            results = send_bulk_resend_email(messages)
+        self.assertEqual(results, [(True, ""), (False, "boom"), (True, "")])
+
+
 class FinancePermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.finance_user = User.objects.create_user(
+            username="finance", password="pass12345", role=User.Roles.LTF_FINANCE
+        )
+        cls.admin_user = User.objects.create_user(
+            username="admin", password="pass12345", role=User.Roles.LTF_ADMIN
+        )
+        cls.other_users = [
+            User.objects.create_user(username=f"role{index}", password="pass12345", role=role)
+            for index, role in enumerate(
+                [User.Roles.CLUB_ADMIN, User.Roles.COACH, User.Roles.MEMBER], start=1
+            )
+        ]
+
     def setUp(self):
         self.factory = APIRequestFactory()
         self.permission = IsLtfFinance()
@@ -231,33 +789,58 @@ class FinancePermissionTests(TestCase):
         return request
 
     def test_ltf_finance_allowed(self):
-        user = User.objects.create_user(username="finance", password="pass12345")
-        user.role = User.Roles.LTF_FINANCE
-        user.save(update_fields=["role"])
-        request = self._request_for_user(user)
+        request = self._request_for_user(self.finance_user)
         self.assertTrue(self.permission.has_permission(request, None))
         self.assertTrue(self.permission_with_admin.has_permission(request, None))
 
     def test_ltf_admin_allowed_in_fallback(self):
-        user = User.objects.create_user(username="admin", password="pass12345")
-        user.role = User.Roles.LTF_ADMIN
-        user.save(update_fields=["role"])
-        request = self._request_for_user(user)
+        request = self._request_for_user(self.admin_user)
         self.assertFalse(self.permission.has_permission(request, None))
         self.assertTrue(self.permission_with_admin.has_permission(request, None))
 
     def test_non_finance_roles_denied(self):
-        roles = [User.Roles.CLUB_ADMIN, User.Roles.COACH, User.Roles.MEMBER]
-        for index, role in enumerate(roles, start=1):
-            user = User.objects.create_user(username=f"role{index}", password="pass12345")
-            user.role = role
-            user.save(update_fields=["role"])
+        for user in self.other_users:
             request = self._request_for_user(user)
             self.assertFalse(self.permission.has_permission(request, None))
             self.assertFalse(self.permission_with_admin.has_permission(request, None))
 
+    def test_result_is_cached_on_request(self):
+        request = self._request_for_user(self.finance_user)
+        self.assertTrue(self.permission.has_permission(request, None))
+        with patch.object(IsLtfFinance, "check_role") as check_mock:
+            self.assertTrue(IsLtfFinance().has_permission(request, None))
+        check_mock.assert_not_called()
+
 
 class CustomAccountAdapterTests(TestCase):
     def test_signup_is_closed(self):
         adapter = CustomAccountAdapter()
         self.assertFalse(adapter.is_open_for_signup(request=None))
+
+    def test_confirmation_url_follows_frontend_base_url_setting(self):
+        adapter = CustomAccountAdapter()
+        request = APIRequestFactory().get("/api/auth/resend-verification/")
+        request.confirmation_locale = "en"
+        confirmation = type("Confirmation", (), {"key": "abc"})()
+        with override_settings(FRONTEND_BASE_URL="https://one.example/"):
+            self.assertEqual(
+                adapter.get_email_confirmation_url(request, confirmation),
+                "https://one.example/en/verify-email?key=abc&locale=en",
+            )
+        with override_settings(FRONTEND_BASE_URL="https://two.example"):
+            self.assertTrue(
+                adapter.get_email_confirmation_url(request, confirmation).startswith(
+                    "https://two.example/en/verify-email?"
+                )
+            )
+
+    def test_locale_resolution_order_and_request_cache(self):
+        adapter = CustomAccountAdapter()
+        request = APIRequestFactory().get("/api/auth/resend-verification/?locale=lb")
+        self.assertEqual(adapter._get_locale(request), "lb")
+        request.confirmation_locale = "en"
+        self.assertEqual(adapter._get_locale(request), "lb")
+
+        request = APIRequestFactory().get("/api/auth/resend-verification/?locale=lb")
+        request.confirmation_locale = "en"
+        self.assertEqual(adapter._get_locale(request), "en")
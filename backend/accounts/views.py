@@ -1,9 +1,14 @@
+import hashlib
+import re
+
 from allauth.account.models import EmailAddress, EmailConfirmationHMAC
 from django.conf import settings
-from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core.cache import cache
+from django.contrib.auth.tokens import default_token_generator
 from django.db import transaction
-from django.utils.encoding import force_bytes, force_str
-from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode
 from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, response, status, views
 from rest_framework.authtoken.models import Token
@@ -12,8 +17,9 @@ from members.models import GradePromotionHistory, Member
 from members.services import clear_member_profile_picture
 from licenses.models import License, LicenseHistoryEvent
 
-from .email_utils import send_password_reset_email
+from .email_utils import send_email_confirmation, send_password_reset_email
 from .models import User
+from .services import get_user_payload
 from .serializers import (
     ConsentSerializer,
     DataDeleteResponseSerializer,
@@ -37,13 +43,14 @@ from .serializers import (
 class LoginView(views.APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = LoginSerializer
+    throttle_scope = "login"
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         user = serializer.validated_data["user"]
         token, _ = Token.objects.get_or_create(user=user)
-        return response.Response({"token": token.key, "user": UserSerializer(user).data})
+        return response.Response({"token": token.key, "user": get_user_payload(user)})
 
 
 @extend_schema(
@@ -66,7 +73,12 @@ class MeView(views.APIView):
     serializer_class = EmptySerializer
 
     def get(self, request):
-        return response.Response(UserSerializer(request.user).data)
+        payload_response = response.Response(get_user_payload(request.user))
+        max_age = settings.ACCOUNT_ME_BROWSER_CACHE_MAX_AGE_SECONDS
+        if max_age > 0:
+            patch_cache_control(payload_response, private=True, max_age=max_age)
+            patch_vary_headers(payload_response, ("Authorization", "Cookie"))
+        return payload_response
 
 
 @extend_schema(
@@ -84,7 +96,7 @@ class ConsentView(views.APIView):
             request.user.give_consent()
         else:
             request.user.revoke_consent()
-        return response.Response(UserSerializer(request.user).data)
+        return response.Response(get_user_payload(request.user))
 
 
 @extend_schema(
@@ -93,86 +105,122 @@ class ConsentView(views.APIView):
 )
 class DataExportView(views.APIView):
     serializer_class = EmptySerializer
+    member_export_fields = (
+        "id",
+        "first_name",
+        "last_name",
+        "belt_rank",
+        "club",
+        "profile_picture_original",
+        "profile_picture_processed",
+        "profile_picture_thumbnail",
+        "photo_edit_metadata",
+        "photo_consent_attested_at",
+        "photo_consent_attested_by",
+    )
+    license_export_fields = ("id", "year", "status", "start_date", "end_date")
+    license_history_export_fields = (
+        "id",
+        "license_id",
+        "event_type",
+        "event_at",
+        "reason",
+        "license_year",
+        "status_before",
+        "status_after",
+        "club_name_snapshot",
+        "order_id",
+        "payment_id",
+    )
+    grade_history_export_fields = (
+        "id",
+        "from_grade",
+        "to_grade",
+        "promotion_date",
+        "exam_date",
+        "proof_ref",
+        "notes",
+        "created_at",
+    )
+    export_chunk_size = 500
+
+    def _export_rows(self, queryset, fields):
+        # Plain tuples are cheaper to fetch than .values() dicts; build each row
+        # dict once from the shared field names while streaming the results.
+        rows = queryset.values_list(*fields).iterator(chunk_size=self.export_chunk_size)
+        return [dict(zip(fields, row)) for row in rows]
 
     def get(self, request):
-        member = Member.objects.filter(user=request.user).first()
-        licenses = License.objects.filter(member=member).values(
-            "id",
-            "year",
-            "status",
-            "start_date",
-            "end_date",
-        )
-        license_history = LicenseHistoryEvent.objects.filter(member=member).values(
-            "id",
-            "license_id",
-            "event_type",
-            "event_at",
-            "reason",
-            "license_year",
-            "status_before",
-            "status_after",
-            "club_name_snapshot",
-            "order_id",
-            "payment_id",
-        )
-        grade_history = GradePromotionHistory.objects.filter(member=member).values(
-            "id",
-            "from_grade",
-            "to_grade",
-            "promotion_date",
-            "exam_date",
-            "proof_ref",
-            "notes",
-            "created_at",
-        )
-        profile_photo = None
-        if member:
-            has_photo = bool(member.profile_picture_processed or member.profile_picture_original)
-            profile_photo = {
-                "has_profile_picture": has_photo,
-                "original_url": (
-                    request.build_absolute_uri(member.profile_picture_original.url)
-                    if member.profile_picture_original
-                    else ""
-                ),
-                "processed_url": (
-                    request.build_absolute_uri(member.profile_picture_processed.url)
-                    if member.profile_picture_processed
-                    else ""
-                ),
-                "thumbnail_url": (
-                    request.build_absolute_uri(member.profile_picture_thumbnail.url)
-                    if member.profile_picture_thumbnail
-                    else ""
-                ),
-                "download_url": (
-                    request.build_absolute_uri(
-                        f"/api/members/{member.id}/profile-picture/download/"
-                    )
-                    if has_photo
-                    else ""
-                ),
-                "photo_edit_metadata": member.photo_edit_metadata or {},
-                "photo_consent_attested_at": member.photo_consent_attested_at,
-                "photo_consent_attested_by": member.photo_consent_attested_by_id,
-            }
         export = {
-            "user": UserSerializer(request.user).data,
+            "user": get_user_payload(request.user),
             "member": None,
-            "profile_photo": profile_photo,
-            "licenses": list(licenses),
-            "license_history": list(license_history),
-            "grade_history": list(grade_history),
+            "profile_photo": None,
+            "licenses": [],
+            "license_history": [],
+            "grade_history": [],
         }
-        if member:
-            export["member"] = {
-                "id": member.id,
-                "first_name": member.first_name,
-                "last_name": member.last_name,
-                "belt_rank": member.belt_rank,
-                "club_id": member.club_id,
-            }
+        member = (
+            Member.objects.filter(user=request.user)
+            .only(*self.member_export_fields)
+            .first()
+        )
+        if member is None:
+            return response.Response(export)
+
+        has_photo = bool(member.profile_picture_processed or member.profile_picture_original)
+        # Resolve scheme and host once; storage URLs that are already absolute
+        # (e.g. a CDN MEDIA_URL) still go through build_absolute_uri.
+        origin = request.build_absolute_uri("/")[:-1]
+
+        def absolute_url(url):
+            if url.startswith("/") and not url.startswith("//"):
+                return f"{origin}{url}"
+            return request.build_absolute_uri(url)
+
+        export["member"] = {
+            "id": member.id,
+            "first_name": member.first_name,
+            "last_name": member.last_name,
+            "belt_rank": member.belt_rank,
+            "club_id": member.club_id,
+        }
+        export["profile_photo"] = {
+            "has_profile_picture": has_photo,
+            "original_url": (
+                absolute_url(member.profile_picture_original.url)
+                if member.profile_picture_original
+                else ""
+            ),
+            "processed_url": (
+                absolute_url(member.profile_picture_processed.url)
+                if member.profile_picture_processed
+                else ""
+            ),
+            "thumbnail_url": (
+                absolute_url(member.profile_picture_thumbnail.url)
+                if member.profile_picture_thumbnail
+                else ""
+            ),
+            "download_url": (
+                f"{origin}/api/members/{member.id}/profile-picture/download/"
+                if has_photo
+                else ""
+            ),
+            "photo_edit_metadata": member.photo_edit_metadata or {},
+            "photo_consent_attested_at": member.photo_consent_attested_at,
+            "photo_consent_attested_by": member.photo_consent_attested_by_id,
+        }
+        export["licenses"] = self._export_rows(
+            License.objects.filter(member_id=member.id), self.license_export_fields
+        )
+        export["license_history"] = self._export_rows(
+            LicenseHistoryEvent.objects.filter(member_id=member.id),
+            self.license_history_export_fields,
+        )
+        export["grade_history"] = self._export_rows(
+            GradePromotionHistory.objects.filter(member_id=member.id),
+            self.grade_history_export_fields,
+        )
         return response.Response(export)
 
 
@@ -185,11 +233,20 @@ class DataDeleteView(views.APIView):
 
     def delete(self, request):
         user_id = request.user.id
-        member = Member.objects.filter(user=request.user).first()
+        member = (
+            Member.objects.filter(user=request.user)
+            .only(
+                "id",
+                "profile_picture_original",
+                "profile_picture_processed",
+                "profile_picture_thumbnail",
+            )
+            .first()
+        )
         with transaction.atomic():
             if member:
                 clear_member_profile_picture(member, clear_consent_attestation=True)
-                GradePromotionHistory.objects.filter(member=member).update(
+                GradePromotionHistory.objects.filter(member_id=member.id).update(
                     notes="",
                     proof_ref="",
                     metadata={"anonymized": True},
@@ -205,22 +262,43 @@ class DataDeleteView(views.APIView):
 class ResendVerificationView(views.APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = ResendVerificationSerializer
+    throttle_scope = "email_verification"
 
     def post(self, request):
         serializer = ResendVerificationSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         email = serializer.validated_data["email"]
-        request.confirmation_locale = serializer.validated_data.get("locale")
+        locale = (
+            serializer.validated_data.get("locale")
+            or request.GET.get("locale")
+            or getattr(request, "LANGUAGE_CODE", None)
+        )
 
-        email_address = EmailAddress.objects.filter(email__iexact=email).first()
+        # allauth stores addresses lowercased, so an exact match on the lowered input
+        # hits the plain index on ``email`` where ``iexact`` (UPPER) would not.
+        email_address = (
+            EmailAddress.objects.only("id", "verified")
+            .filter(email=email.lower())
+            .first()
+        )
         if email_address and not email_address.verified:
-            email_address.send_confirmation(request)
+            send_email_confirmation(email_address, locale)
 
         return response.Response(
             {"detail": "If the email exists, a verification link has been sent."}
         )
 
 
+# allauth confirmation keys are signed, URL-safe base64 with ":" separators
+# (HMAC) or 64 lowercase alphanumerics (stored confirmations).
+_EMAIL_CONFIRMATION_KEY_PATTERN = re.compile(r"[A-Za-z0-9_:-]{20,512}")
+
+
+def _verified_email_key_cache_key(key: str) -> str:
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f"accounts:verified_email_key:v1:{digest}"
+
+
 @extend_schema(
     request=VerifyEmailSerializer,
     responses=DetailResponseSerializer,
@@ -228,11 +306,24 @@ class ResendVerificationView(views.APIView):
 class VerifyEmailView(views.APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = VerifyEmailSerializer
+    throttle_scope = "email_verification"
 
     def post(self, request):
         serializer = VerifyEmailSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         key = serializer.validated_data["key"]
+        # Malformed keys cannot verify; reject them before hashing or unsigning.
+        if not _EMAIL_CONFIRMATION_KEY_PATTERN.fullmatch(key):
+            return response.Response(
+                {"detail": "Invalid or expired verification key."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        cache_key = _verified_email_key_cache_key(key)
+        ttl = settings.ACCOUNT_EMAIL_VERIFY_CACHE_TTL_SECONDS
+
+        # Client retries of an already confirmed key skip the HMAC unsign and lookup.
+        if ttl > 0 and cache.get(cache_key) is not None:
+            return response.Response({"detail": "Email verified successfully."})
 
         confirmation = EmailConfirmationHMAC.from_key(key)
         if not confirmation:
@@ -242,6 +333,8 @@ class VerifyEmailView(views.APIView):
             )
 
         confirmation.confirm(request)
+        if ttl > 0:
+            cache.set(cache_key, confirmation.email_address.id, timeout=ttl)
         return response.Response({"detail": "Email verified successfully."})
 
 
@@ -252,6 +345,7 @@ class VerifyEmailView(views.APIView):
 class PasswordResetRequestView(views.APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = PasswordResetRequestSerializer
+    throttle_scope = "password_reset"
 
     def post(self, request):
         serializer = PasswordResetRequestSerializer(data=request.data)
@@ -263,13 +357,7 @@ class PasswordResetRequestView(views.APIView):
             or settings.FRONTEND_DEFAULT_LOCALE
         )
 
-        user = User.objects.filter(email__iexact=email).first()
-        if user:
-            token = PasswordResetTokenGenerator().make_token(user)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-            reset_url = f"{settings.FRONTEND_BASE_URL}/{locale}/reset-password?uid={uid}&token={token}"
-            ok, _ = send_password_reset_email(user, reset_url)
-
+        send_password_reset_email(email, locale)
         return response.Response(
             {"detail": "If the email exists, a reset link has been sent."}
         )
@@ -282,6 +370,7 @@ class PasswordResetRequestView(views.APIView):
 class PasswordResetConfirmView(views.APIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = PasswordResetConfirmSerializer
+    throttle_scope = "password_reset"
 
     def post(self, request):
         serializer = PasswordResetConfirmSerializer(data=request.data)
@@ -299,9 +388,8 @@ class PasswordResetConfirmView(views.APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        token_ok = PasswordResetTokenGenerator().check_token(user, token)
-
-        if not token_ok:
+        # Inactive accounts cannot reset their password, so skip the HMAC check.
+        if not user.is_active or not default_token_generator.check_token(user, token):
             return response.Response(
                 {"detail": "Invalid or expired reset link."},
                 status=status.HTTP_400_BAD_REQUEST,
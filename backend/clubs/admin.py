@@ -6,6 +6,7 @@ from .models import BrandingAsset, Club, FederationProfile
 @admin.register(Club)
 class ClubAdmin(admin.ModelAdmin):
     list_display = ("name", "locality", "postal_code", "iban", "bank_name", "created_by")
+    list_select_related = ("created_by",)
     search_fields = (
         "name",
         "locality",
@@ -37,4 +38,5 @@ class BrandingAssetAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("scope_type", "asset_type", "usage_type", "is_selected")
+    list_select_related = ("club", "federation_profile", "uploaded_by")
     search_fields = ("label", "file")
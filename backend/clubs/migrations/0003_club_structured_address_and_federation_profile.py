@@ -1,16 +1,12 @@
 from django.db import migrations, models
+from django.db.models import F
 
 
 def backfill_structured_club_addresses(apps, schema_editor):
+    # One set-based UPDATE per column instead of one UPDATE per club.
     Club = apps.get_model("clubs", "Club")
-    for club in Club.objects.all().iterator():
-        updates = {}
-        if not club.address_line1 and club.address:
-            updates["address_line1"] = club.address
-        if not club.locality and club.city:
-            updates["locality"] = club.city
-        if updates:
-            Club.objects.filter(id=club.id).update(**updates)
+    Club.objects.filter(address_line1="").exclude(address="").update(address_line1=F("address"))
+    Club.objects.filter(locality="").exclude(city="").update(locality=F("city"))
 
 
 def noop_reverse(apps, schema_editor):
@@ -1,11 +1,12 @@
 from django.conf import settings
 from django.db import migrations, models
 import django.db.models.deletion
-import re
 
 import clubs.models
 
 
+# Frozen copies of the clubs.banking helpers; a migration must not follow later
+# changes to the runtime bank map or derivation.
 _LUXEMBOURG_BANK_CODE_MAP = {
     "0001": "Spuerkeess (BCEE)",
     "0002": "Banque Internationale a Luxembourg (BIL)",
@@ -14,18 +15,11 @@ _LUXEMBOURG_BANK_CODE_MAP = {
     "0014": "ING Luxembourg",
     "0019": "POST Luxembourg",
     "0020": "Banque de Luxembourg",
-    "001": "Spuerkeess (BCEE)",
-    "002": "Banque Internationale a Luxembourg (BIL)",
-    "003": "BGL BNP Paribas",
-    "009": "Banque Raiffeisen",
-    "014": "ING Luxembourg",
-    "019": "POST Luxembourg",
-    "020": "Banque de Luxembourg",
 }
 
 
 def _normalize_iban(raw_value: str | None) -> str:
-    return re.sub(r"\s+", "", str(raw_value or "")).upper()
+    return "".join(str(raw_value or "").split()).upper()
 
 
 def _derive_bank_name(iban: str) -> str:
@@ -34,35 +28,55 @@ def _derive_bank_name(iban: str) -> str:
         return ""
     if normalized.startswith("LU") and len(normalized) >= 8:
         code4 = normalized[4:8]
-        code3 = normalized[4:7]
-        return _LUXEMBOURG_BANK_CODE_MAP.get(
-            code4,
-            _LUXEMBOURG_BANK_CODE_MAP.get(code3, f"Luxembourg bank ({code4})"),
+        # 3-digit codes resolve through their zero-padded 4-digit key; the
+        # fallback lookup only runs when the 4-digit code misses.
+        return (
+            _LUXEMBOURG_BANK_CODE_MAP.get(code4)
+            or _LUXEMBOURG_BANK_CODE_MAP.get(f"0{code4[:3]}")
+            or f"Luxembourg bank ({code4})"
         )
     if len(normalized) >= 8:
         return f"Bank identifier {normalized[4:8]}"
     return "Bank"
 
 
-def _backfill_bank_names(apps, schema_editor):
-    Club = apps.get_model("clubs", "Club")
-    FederationProfile = apps.get_model("clubs", "FederationProfile")
+_BACKFILL_BATCH_SIZE = 1000
+
+
+def _iter_rows_by_pk(queryset, *fields, chunk_size=_BACKFILL_BATCH_SIZE):
+    # Keyset pagination keeps memory bounded without relying on server-side
+    # cursors, which are unavailable behind PgBouncer in transaction mode.
+    rows = queryset.order_by("pk").values_list("pk", *fields)
+    last_pk = None
+    while True:
+        page = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        chunk = list(page[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1][0]
 
-    for club in Club.objects.exclude(iban="").iterator():
-        normalized = _normalize_iban(getattr(club, "iban", ""))
-        bank_name = _derive_bank_name(normalized)
-        if club.iban != normalized or club.bank_name != bank_name:
-            club.iban = normalized
-            club.bank_name = bank_name
-            club.save(update_fields=["iban", "bank_name"])
 
-    for profile in FederationProfile.objects.exclude(iban="").iterator():
-        normalized = _normalize_iban(getattr(profile, "iban", ""))
+def _backfill_model_bank_names(model):
+    # Stream plain tuples and only build (pk-only) instances for rows that
+    # change; they are written with one bulk_update per batch.
+    batch = []
+    rows = _iter_rows_by_pk(model.objects.exclude(iban=""), "iban", "bank_name")
+    for pk, iban, current_bank_name in rows:
+        normalized = _normalize_iban(iban)
         bank_name = _derive_bank_name(normalized)
-        if profile.iban != normalized or profile.bank_name != bank_name:
-            profile.iban = normalized
-            profile.bank_name = bank_name
-            profile.save(update_fields=["iban", "bank_name"])
+        if iban != normalized or current_bank_name != bank_name:
+            batch.append(model(pk=pk, iban=normalized, bank_name=bank_name))
+        if len(batch) >= _BACKFILL_BATCH_SIZE:
+            model.objects.bulk_update(batch, ["iban", "bank_name"])
+            batch.clear()
+    if batch:
+        model.objects.bulk_update(batch, ["iban", "bank_name"])
+
+
+def _backfill_bank_names(apps, schema_editor):
+    _backfill_model_bank_names(apps.get_model("clubs", "Club"))
+    _backfill_model_bank_names(apps.get_model("clubs", "FederationProfile"))
 
 
 def _noop(apps, schema_editor):
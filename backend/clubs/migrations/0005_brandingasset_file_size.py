@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def backfill_branding_asset_file_sizes(apps, schema_editor):
+    BrandingAsset = apps.get_model("clubs", "BrandingAsset")
+    updated = []
+    for asset in BrandingAsset.objects.exclude(file="").only("id", "file").iterator():
+        try:
+            asset.file_size = asset.file.size
+        except OSError:
+            continue
+        updated.append(asset)
+    BrandingAsset.objects.bulk_update(updated, ["file_size"], batch_size=500)
+
+
+def noop_reverse(apps, schema_editor):
+    return
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clubs", "0004_club_banking_and_branding_assets"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="brandingasset",
+            name="file_size",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_branding_asset_file_sizes, noop_reverse),
+    ]
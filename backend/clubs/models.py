@@ -1,4 +1,3 @@
-import re
 from pathlib import Path
 from uuid import uuid4
 
@@ -9,14 +8,28 @@ from django.utils.translation import gettext_lazy as _
 
 from .banking import derive_bank_name_from_iban, is_valid_iban, normalize_iban
 
+def is_luxembourg_postal_code(value: str) -> bool:
+    # Four ASCII digits; cheaper than a regex match for such a short string.
+    return len(value) == 4 and value.isascii() and value.isdigit()
+
+
 def _validate_luxembourg_postal_code(postal_code: str) -> None:
     normalized_postal_code = str(postal_code or "").strip()
-    if normalized_postal_code and not re.fullmatch(r"\d{4}", normalized_postal_code):
+    if normalized_postal_code and not is_luxembourg_postal_code(normalized_postal_code):
         raise ValidationError(
             {"postal_code": _("Postal code must be 4 digits for Luxembourg.")}
         )
 
 
+def _clean_postal_address_and_bank(instance) -> None:
+    _validate_luxembourg_postal_code(instance.postal_code)
+    normalized_iban = normalize_iban(instance.iban)
+    if normalized_iban and not is_valid_iban(normalized_iban):
+        raise ValidationError({"iban": _("Enter a valid IBAN.")})
+    instance.iban = normalized_iban
+    instance.bank_name = derive_bank_name_from_iban(normalized_iban)
+
+
 class Club(models.Model):
     name = models.CharField(max_length=255)
     city = models.CharField(max_length=255, blank=True)
@@ -42,26 +55,16 @@ class Club(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def clean(self):
-        _validate_luxembourg_postal_code(self.postal_code)
-        normalized_iban = normalize_iban(self.iban)
-        if normalized_iban and not is_valid_iban(normalized_iban):
-            raise ValidationError({"iban": _("Enter a valid IBAN.")})
-        self.iban = normalized_iban
-        self.bank_name = derive_bank_name_from_iban(normalized_iban)
+        _clean_postal_address_and_bank(self)
 
     @property
     def formatted_address(self) -> str:
-        lines = []
-        if self.address_line1:
-            lines.append(self.address_line1)
-        if self.address_line2:
-            lines.append(self.address_line2)
         postal_locality = " ".join(
-            part for part in [self.postal_code.strip(), self.locality.strip()] if part
-        ).strip()
-        if postal_locality:
-            lines.append(postal_locality)
-        return ", ".join(lines)
+            part for part in (self.postal_code.strip(), self.locality.strip()) if part
+        )
+        return ", ".join(
+            part for part in (self.address_line1, self.address_line2, postal_locality) if part
+        )
 
     def __str__(self):
         return self.name
@@ -83,12 +86,7 @@ class FederationProfile(models.Model):
         verbose_name_plural = "Federation profile"
 
     def clean(self):
-        _validate_luxembourg_postal_code(self.postal_code)
-        normalized_iban = normalize_iban(self.iban)
-        if normalized_iban and not is_valid_iban(normalized_iban):
-            raise ValidationError({"iban": _("Enter a valid IBAN.")})
-        self.iban = normalized_iban
-        self.bank_name = derive_bank_name_from_iban(normalized_iban)
+        _clean_postal_address_and_bank(self)
 
     def save(self, *args, **kwargs):
         if self.pk is None:
@@ -166,6 +164,8 @@ class BrandingAsset(models.Model):
     )
     label = models.CharField(max_length=120, blank=True)
     file = models.FileField(upload_to=branding_asset_upload_to, max_length=500)
+    # Recorded at upload so listings do not stat the stored file per asset.
+    file_size = models.PositiveBigIntegerField(default=0)
     is_selected = models.BooleanField(default=False)
     uploaded_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -232,3 +232,12 @@ class BrandingAsset(models.Model):
         else:
             scope = f"federation:{self.federation_profile_id}"
         return f"{scope}:{self.asset_type}:{self.usage_type}:{self.id}"
+
+    def save(self, *args, **kwargs):
+        if self.file and not self.file._committed:
+            # Fresh uploads know their size in memory; no storage access needed.
+            self.file_size = self.file.size
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "file" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "file_size"}
+        super().save(*args, **kwargs)
@@ -1,12 +1,41 @@
-import re
-
 from rest_framework import serializers
 
 from .banking import derive_bank_name_from_iban, is_valid_iban, normalize_iban
-from .models import BrandingAsset, Club, FederationProfile
+from .models import BrandingAsset, Club, FederationProfile, is_luxembourg_postal_code
+
+
+class PostalAddressAndBankSerializerMixin:
+    """Shared postal code and IBAN handling for clubs and the federation profile."""
+
+    def validate_postal_code(self, value):
+        return str(value or "").strip()
+
+    def validate_iban(self, value):
+        normalized = normalize_iban(value)
+        if normalized and not is_valid_iban(normalized):
+            raise serializers.ValidationError("Enter a valid IBAN.")
+        return normalized
+
+    def validate_postal_address_and_bank(self, attrs):
+        postal_code = str(
+            attrs.get(
+                "postal_code",
+                getattr(self.instance, "postal_code", ""),
+            )
+            or ""
+        ).strip()
+        if postal_code and not is_luxembourg_postal_code(postal_code):
+            raise serializers.ValidationError(
+                {"postal_code": "Postal code must be 4 digits for Luxembourg."}
+            )
+        # validate_iban already normalized and checked the value; only the
+        # bank name is derived here, once per request.
+        if "iban" in attrs:
+            attrs["bank_name"] = derive_bank_name_from_iban(attrs["iban"])
+        return attrs
 
 
-class ClubSerializer(serializers.ModelSerializer):
+class ClubSerializer(PostalAddressAndBankSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Club
         fields = [
@@ -28,15 +57,6 @@ class ClubSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["bank_name", "created_by", "created_at", "updated_at"]
 
-    def validate_postal_code(self, value):
-        return str(value or "").strip()
-
-    def validate_iban(self, value):
-        normalized = normalize_iban(value)
-        if normalized and not is_valid_iban(normalized):
-            raise serializers.ValidationError("Enter a valid IBAN.")
-        return normalized
-
     def validate(self, attrs):
         attrs = super().validate(attrs)
 
@@ -50,25 +70,12 @@ class ClubSerializer(serializers.ModelSerializer):
         if attrs.get("locality") not in (None, ""):
             attrs["city"] = str(attrs["locality"]).strip()
 
-        postal_code = str(
-            attrs.get(
-                "postal_code",
-                getattr(self.instance, "postal_code", ""),
-            )
-            or ""
-        ).strip()
-        if postal_code and not re.fullmatch(r"\d{4}", postal_code):
-            raise serializers.ValidationError(
-                {"postal_code": "Postal code must be 4 digits for Luxembourg."}
-            )
-        if "iban" in attrs:
-            attrs["bank_name"] = derive_bank_name_from_iban(attrs["iban"])
-        elif attrs.get("iban"):
-            attrs["bank_name"] = derive_bank_name_from_iban(attrs["iban"])
-        return attrs
+        return self.validate_postal_address_and_bank(attrs)
 
 
-class FederationProfileSerializer(serializers.ModelSerializer):
+class FederationProfileSerializer(
+    PostalAddressAndBankSerializerMixin, serializers.ModelSerializer
+):
     class Meta:
         model = FederationProfile
         fields = [
@@ -85,39 +92,30 @@ class FederationProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["bank_name", "created_at", "updated_at"]
 
-    def validate_postal_code(self, value):
-        return str(value or "").strip()
-
-    def validate_iban(self, value):
-        normalized = normalize_iban(value)
-        if normalized and not is_valid_iban(normalized):
-            raise serializers.ValidationError("Enter a valid IBAN.")
-        return normalized
-
     def validate(self, attrs):
         attrs = super().validate(attrs)
-        postal_code = str(
-            attrs.get(
-                "postal_code",
-                getattr(self.instance, "postal_code", ""),
-            )
-            or ""
-        ).strip()
-        if postal_code and not re.fullmatch(r"\d{4}", postal_code):
-            raise serializers.ValidationError(
-                {"postal_code": "Postal code must be 4 digits for Luxembourg."}
-            )
-        if "iban" in attrs:
-            attrs["bank_name"] = derive_bank_name_from_iban(attrs["iban"])
-        elif attrs.get("iban"):
-            attrs["bank_name"] = derive_bank_name_from_iban(attrs["iban"])
-        return attrs
+        return self.validate_postal_address_and_bank(attrs)
 
 
 class BrandingAssetSerializer(serializers.ModelSerializer):
     content_url = serializers.SerializerMethodField()
     file_name = serializers.SerializerMethodField()
-    file_size = serializers.SerializerMethodField()
+
+    # Columns read by the fields below; list views load only these.
+    queryset_fields = (
+        "id",
+        "scope_type",
+        "asset_type",
+        "usage_type",
+        "label",
+        "is_selected",
+        "file",
+        "file_size",
+        "club_id",
+        "federation_profile_id",
+        "created_at",
+        "updated_at",
+    )
 
     class Meta:
         model = BrandingAsset
@@ -136,13 +134,7 @@ class BrandingAssetSerializer(serializers.ModelSerializer):
         ]
 
     def get_file_name(self, obj: BrandingAsset) -> str:
-        return str(obj.file.name or "").split("/")[-1]
-
-    def get_file_size(self, obj: BrandingAsset) -> int:
-        try:
-            return int(obj.file.size)
-        except Exception:
-            return 0
+        return str(obj.file.name or "").rpartition("/")[2]
 
     def get_content_url(self, obj: BrandingAsset) -> str | None:
         request = self.context.get("request")
@@ -1,39 +1,55 @@
 import json
+import math
 from io import BytesIO
+from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from accounts.models import User
+from config.testing import TemporaryMediaRootMixin
+from imports.csv_utils import MAX_ROWS, read_csv
 from licenses.models import License, LicenseType
 from members.models import Member
 
-from .models import BrandingAsset, Club, FederationProfile
+from .banking import derive_bank_name_from_iban, is_valid_iban, normalize_iban
+from .models import BrandingAsset, Club, FederationProfile, is_luxembourg_postal_code
 
+ONE_PIXEL_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc``\x00\x00"
+    b"\x00\x03\x00\x01h&Y\r\x00\x00\x00\x00IEND\xaeB`\x82"
+)
 
-class ClubApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.ltf_admin = User.objects.create_user(
+
+class ClubApiTests(TemporaryMediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ltf_admin = User.objects.create_user(
             username="ltfadmin",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
-        self.club_admin = User.objects.create_user(
+        cls.club_admin = User.objects.create_user(
             username="clubadmin",
             password="pass12345",
             role=User.Roles.CLUB_ADMIN,
         )
 
-        self.club = Club.objects.create(
+        cls.club = Club.objects.create(
             name="Main Club",
             city="Luxembourg",
             address="1 Main St",
-            created_by=self.ltf_admin,
+            created_by=cls.ltf_admin,
         )
-        self.club.admins.add(self.club_admin)
+        cls.club.admins.add(cls.club_admin)
+
+    def setUp(self):
+        self.client = APIClient()
 
     def test_ltf_admin_sees_all_clubs(self):
         self.client.force_authenticate(user=self.ltf_admin)
@@ -47,6 +63,27 @@ class ClubApiTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
 
+    def test_club_list_query_count_does_not_grow_with_clubs(self):
+        extra_clubs = Club.objects.bulk_create(
+            [
+                Club(name=f"Extra Club {index}", created_by=self.ltf_admin)
+                for index in range(20)
+            ]
+        )
+        for club in extra_clubs:
+            club.admins.add(self.club_admin)
+
+        self.client.force_authenticate(user=self.ltf_admin)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/clubs/")
+        self.assertEqual(len(response.data), 21)
+        self.assertEqual(response.data[0]["admins"], [self.club_admin.id])
+
+        self.client.force_authenticate(user=self.club_admin)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/clubs/")
+        self.assertEqual(len(response.data), 21)
+
     def test_cannot_delete_club_with_members(self):
         member = Member.objects.create(
             club=self.club,
@@ -57,7 +94,7 @@ class ClubApiTests(TestCase):
         response = self.client.delete(f"/api/clubs/{self.club.id}/")
         self.assertEqual(response.status_code, 409)
         self.assertIn("members", response.data.get("detail", "").lower())
-        member.refresh_from_db()
+        self.assertTrue(Member.objects.filter(pk=member.pk).exists())
 
     def test_cannot_delete_club_with_licenses(self):
         member = Member.objects.create(
@@ -117,15 +154,7 @@ class ClubApiTests(TestCase):
         self.assertIn("postal_code", response.data)
 
     def _logo_file(self, name: str = "logo.png") -> SimpleUploadedFile:
-        return SimpleUploadedFile(
-            name,
-            (
-                b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
-                b"\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc``\x00\x00"
-                b"\x00\x03\x00\x01h&Y\r\x00\x00\x00\x00IEND\xaeB`\x82"
-            ),
-            content_type="image/png",
-        )
+        return SimpleUploadedFile(name, ONE_PIXEL_PNG, content_type="image/png")
 
     def test_ltf_admin_can_manage_club_logos(self):
         self.client.force_authenticate(user=self.ltf_admin)
@@ -141,10 +170,13 @@ class ClubApiTests(TestCase):
         )
         self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
         logo_id = create_response.data["id"]
+        self.assertEqual(create_response.data["file_size"], len(ONE_PIXEL_PNG))
+        self.assertEqual(BrandingAsset.objects.get(id=logo_id).file_size, len(ONE_PIXEL_PNG))
 
         list_response = self.client.get(f"/api/clubs/{self.club.id}/logos/")
         self.assertEqual(list_response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(list_response.data["logos"]), 1)
+        self.assertEqual(list_response.data["logos"][0]["file_size"], len(ONE_PIXEL_PNG))
 
         patch_response = self.client.patch(
             f"/api/clubs/{self.club.id}/logos/{logo_id}/",
@@ -268,14 +300,17 @@ class ClubApiTests(TestCase):
 
 
 class ClubImportTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.ltf_admin = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.ltf_admin = User.objects.create_user(
             username="ltfadmin",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_preview_requires_auth(self):
         response = self.client.post("/api/imports/clubs/preview/")
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -299,13 +334,16 @@ class ClubImportTests(TestCase):
         file_obj = BytesIO(csv_data.encode("utf-8"))
         file_obj.name = "clubs.csv"
         mapping = {"name": "name", "city": "city", "address": "address"}
-        response = self.client.post(
-            "/api/imports/clubs/confirm/",
-            {"file": file_obj, "mapping": json.dumps(mapping)},
-            format="multipart",
-        )
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                "/api/imports/clubs/confirm/",
+                {"file": file_obj, "mapping": json.dumps(mapping)},
+                format="multipart",
+            )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 2)
         self.assertEqual(Club.objects.count(), 2)
+        self.assertEqual(self._count_club_inserts(queries), 1)
         created = Club.objects.order_by("id").first()
         self.assertEqual(created.address_line1, "Main St")
         self.assertEqual(created.locality, "Lux")
@@ -340,34 +378,67 @@ class ClubImportTests(TestCase):
         self.assertEqual(created.iban, "LU280019400644750000")
         self.assertEqual(created.bank_name, "POST Luxembourg")
 
+    def test_confirm_inserts_clubs_in_batches(self):
+        # A small batch size exercises the batching path without a huge CSV.
+        row_count, batch_size = 50, 20
+        self.client.force_authenticate(user=self.ltf_admin)
+        csv_data = "name,city\n" + "".join(
+            f"Batch Club {index},Lux\n" for index in range(row_count)
+        )
+        file_obj = BytesIO(csv_data.encode("utf-8"))
+        file_obj.name = "clubs_batch.csv"
+        mapping = {"name": "name", "city": "city"}
+        with patch("imports.views.CLUB_IMPORT_BATCH_SIZE", batch_size):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    "/api/imports/clubs/confirm/",
+                    {"file": file_obj, "mapping": json.dumps(mapping)},
+                    format="multipart",
+                )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], row_count)
+        self.assertEqual(Club.objects.count(), row_count)
+        self.assertEqual(self._count_club_inserts(queries), math.ceil(row_count / batch_size))
+
+    @staticmethod
+    def _count_club_inserts(queries) -> int:
+        return sum(
+            1
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "clubs_club"')
+        )
+
 
 class ClubAdminManagementTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.ltf_admin = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.ltf_admin = User.objects.create_user(
             username="ltfadmin",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
-        self.member_user = User.objects.create_user(
+        cls.member_user = User.objects.create_user(
             username="memberuser",
             password="pass12345",
             role=User.Roles.MEMBER,
         )
-        self.club = Club.objects.create(
+        cls.club = Club.objects.create(
             name="Admin Club",
             city="Luxembourg",
             address="1 Admin Rd",
-            created_by=self.ltf_admin,
+            created_by=cls.ltf_admin,
             max_admins=1,
         )
         Member.objects.create(
-            user=self.member_user,
-            club=self.club,
+            user=cls.member_user,
+            club=cls.club,
             first_name="Lina",
             last_name="Muller",
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_add_admin_respects_limit(self):
         self.client.force_authenticate(user=self.ltf_admin)
         response = self.client.post(
@@ -399,6 +470,46 @@ class ClubAdminManagementTests(TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
+    @override_settings(RESEND_API_KEY="test-key")
+    def test_add_admin_for_new_account_reports_queued_welcome_email(self):
+        member = Member.objects.create(
+            club=self.club,
+            first_name="Nora",
+            last_name="Klein",
+        )
+        self.client.force_authenticate(user=self.ltf_admin)
+        with patch("accounts.tasks.send_club_admin_welcome_email_task.delay") as delay_mock:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    f"/api/clubs/{self.club.id}/add_admin/",
+                    {"member_id": member.id, "email": "nora@example.com"},
+                    format="json",
+                )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["welcome_email"], "queued")
+        member.refresh_from_db()
+        delay_mock.assert_called_once()
+        self.assertEqual(delay_mock.call_args.args, (member.user_id, self.club.id, "en"))
+
+    @override_settings(RESEND_API_KEY="")
+    def test_add_admin_reports_unsent_welcome_email_without_api_key(self):
+        member = Member.objects.create(
+            club=self.club,
+            first_name="Nora",
+            last_name="Klein",
+        )
+        self.client.force_authenticate(user=self.ltf_admin)
+        response = self.client.post(
+            f"/api/clubs/{self.club.id}/add_admin/",
+            {"member_id": member.id, "email": "nora@example.com"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["welcome_email"], "not_sent")
+        self.assertEqual(response.data["error"], "missing_resend_api_key")
+        member.refresh_from_db()
+        self.assertTrue(self.club.admins.filter(id=member.user_id).exists())
+
     def test_remove_admin_resets_role(self):
         self.client.force_authenticate(user=self.ltf_admin)
         self.client.post(
@@ -427,25 +538,28 @@ class ClubAdminManagementTests(TestCase):
         self.assertEqual(self.club.max_admins, 5)
 
 
-class FederationProfileApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.ltf_admin = User.objects.create_user(
+class FederationProfileApiTests(TemporaryMediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ltf_admin = User.objects.create_user(
             username="fed-ltf-admin",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
-        self.ltf_finance = User.objects.create_user(
+        cls.ltf_finance = User.objects.create_user(
             username="fed-ltf-finance",
             password="pass12345",
             role=User.Roles.LTF_FINANCE,
         )
-        self.club_admin = User.objects.create_user(
+        cls.club_admin = User.objects.create_user(
             username="fed-club-admin",
             password="pass12345",
             role=User.Roles.CLUB_ADMIN,
         )
 
+    def setUp(self):
+        self.client = APIClient()
+
     def test_get_creates_singleton_profile_for_ltf_admin(self):
         self.client.force_authenticate(user=self.ltf_admin)
         response = self.client.get("/api/federation-profile/")
@@ -512,15 +626,7 @@ class FederationProfileApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def _logo_file(self, name: str = "federation-logo.png") -> SimpleUploadedFile:
-        return SimpleUploadedFile(
-            name,
-            (
-                b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
-                b"\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc``\x00\x00"
-                b"\x00\x03\x00\x01h&Y\r\x00\x00\x00\x00IEND\xaeB`\x82"
-            ),
-            content_type="image/png",
-        )
+        return SimpleUploadedFile(name, ONE_PIXEL_PNG, content_type="image/png")
 
     def test_ltf_admin_can_patch_federation_iban_and_derives_bank_name(self):
         self.client.force_authenticate(user=self.ltf_admin)
@@ -609,36 +715,39 @@ class FederationProfileApiTests(TestCase):
         self.assertEqual(patch_response.status_code, status.HTTP_403_FORBIDDEN)
 
 
-class BrandingAssetApiTests(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.ltf_admin = User.objects.create_user(
+class BrandingAssetApiTests(TemporaryMediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ltf_admin = User.objects.create_user(
             username="brand-ltf-admin",
             password="pass12345",
             role=User.Roles.LTF_ADMIN,
         )
-        self.ltf_finance = User.objects.create_user(
+        cls.ltf_finance = User.objects.create_user(
             username="brand-ltf-finance",
             password="pass12345",
             role=User.Roles.LTF_FINANCE,
         )
-        self.club_admin = User.objects.create_user(
+        cls.club_admin = User.objects.create_user(
             username="brand-club-admin",
             password="pass12345",
             role=User.Roles.CLUB_ADMIN,
         )
-        self.member_user = User.objects.create_user(
+        cls.member_user = User.objects.create_user(
             username="brand-member",
             password="pass12345",
             role=User.Roles.MEMBER,
         )
-        self.club = Club.objects.create(
+        cls.club = Club.objects.create(
             name="Brand Club",
             city="Luxembourg",
             address="1 Brand Street",
-            created_by=self.ltf_admin,
+            created_by=cls.ltf_admin,
         )
-        self.club.admins.add(self.club_admin)
+        cls.club.admins.add(cls.club_admin)
+
+    def setUp(self):
+        self.client = APIClient()
 
     def _make_logo(self, name: str = "logo.png") -> SimpleUploadedFile:
         return SimpleUploadedFile(name, b"fake-image-bytes", content_type="image/png")
@@ -739,3 +848,65 @@ class BrandingAssetApiTests(TestCase):
             format="multipart",
         )
         self.assertEqual(post_response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ClubFormattedAddressTests(SimpleTestCase):
+    def test_formatted_address_skips_empty_parts(self):
+        club = Club(
+            address_line1="1 Rue de la Gare",
+            address_line2="",
+            postal_code=" 1234 ",
+            locality="Luxembourg",
+        )
+        self.assertEqual(club.formatted_address, "1 Rue de la Gare, 1234 Luxembourg")
+        self.assertEqual(Club(locality=" Esch ").formatted_address, "Esch")
+        self.assertEqual(Club().formatted_address, "")
+
+
+class PostalCodeHelperTests(SimpleTestCase):
+    def test_is_luxembourg_postal_code(self):
+        self.assertTrue(is_luxembourg_postal_code("1234"))
+        for value in ("", "123", "12345", "12a4", "١٢٣٤", "12²4"):
+            with self.subTest(value=value):
+                self.assertFalse(is_luxembourg_postal_code(value))
+
+
+class IbanHelperTests(SimpleTestCase):
+    def test_normalize_iban_strips_whitespace_and_uppercases(self):
+        self.assertEqual(
+            normalize_iban(" lu28 0019\t4006 4475 0000 "), "LU280019400644750000"
+        )
+        self.assertEqual(normalize_iban(None), "")
+
+    def test_is_valid_iban_checks_mod_97(self):
+        self.assertTrue(is_valid_iban("LU28 0019 4006 4475 0000"))
+        self.assertTrue(is_valid_iban("GB82 WEST 1234 5698 7654 32"))
+        self.assertFalse(is_valid_iban("LU29 0019 4006 4475 0000"))
+        self.assertFalse(is_valid_iban("LU28-0019-4006-4475-0000"))
+        self.assertFalse(is_valid_iban("LU28 0019"))
+
+    def test_derive_bank_name_from_iban(self):
+        cases = {
+            "LU28 0019 4006 4475 0000": "POST Luxembourg",
+            "LU12 0099 0000 0000 0000": "Banque Raiffeisen",
+            "LU12 0123 0000 0000 0000": "Luxembourg bank (0123)",
+            "GB82 WEST 1234 5698 7654 32": "Bank identifier WEST",
+            "": "",
+        }
+        for iban, bank_name in cases.items():
+            with self.subTest(iban=iban):
+                self.assertEqual(derive_bank_name_from_iban(iban), bank_name)
+
+
+class ImportCsvReaderTests(SimpleTestCase):
+    def test_read_csv_strips_headers_and_bom(self):
+        headers, rows = read_csv(BytesIO("\ufeffname , city\nClub A,Lux\n".encode("utf-8")))
+        self.assertEqual(headers, ["name", "city"])
+        self.assertEqual(rows, [["Club A", "Lux"]])
+
+    def test_read_csv_caps_data_rows(self):
+        payload = "name\n" + "".join(f"Club {index}\n" for index in range(MAX_ROWS + 10))
+        headers, rows = read_csv(BytesIO(payload.encode("utf-8")))
+        self.assertEqual(headers, ["name"])
+        self.assertEqual(len(rows), MAX_ROWS)
+        self.assertEqual(rows[-1], [f"Club {MAX_ROWS - 1}"])
@@ -16,12 +16,10 @@ from accounts.permissions import (
 )
 from config.pagination import OptionalPaginationListMixin
 from django.conf import settings
-from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.db import transaction
+from django.db.models import Prefetch
 from django.http import FileResponse
 from django.utils.crypto import get_random_string
-from django.utils.encoding import force_bytes
-from django.utils.http import urlsafe_base64_encode
 
 from accounts.models import User
 from accounts.email_utils import send_club_admin_welcome_email
@@ -135,15 +133,22 @@ class ClubViewSet(OptionalPaginationListMixin, viewsets.ModelViewSet):
         ]:
             return Club.objects.all()
         if user.role in ["ltf_admin", "ltf_finance"]:
-            return Club.objects.all()
-        if user.role == "club_admin":
-            return Club.objects.filter(admins=user).distinct()
-        if user.role == "coach":
-            return Club.objects.filter(members__user=user).distinct()
-        return (
-            Club.objects.filter(admins=user)
-            | Club.objects.filter(members__user=user)
-        ).distinct()
+            queryset = Club.objects.all()
+        elif user.role == "club_admin":
+            queryset = Club.objects.filter(admins=user).distinct()
+        elif user.role == "coach":
+            queryset = Club.objects.filter(members__user=user).distinct()
+        else:
+            queryset = (
+                Club.objects.filter(admins=user)
+                | Club.objects.filter(members__user=user)
+            ).distinct()
+        if self.action in ["list", "retrieve"]:
+            # ClubSerializer renders admin ids; fetch them for all clubs in one query.
+            queryset = queryset.prefetch_related(
+                Prefetch("admins", queryset=User.objects.only("id"))
+            )
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -273,17 +278,17 @@ class ClubViewSet(OptionalPaginationListMixin, viewsets.ModelViewSet):
             user.role = "club_admin"
             user.save(update_fields=["role"])
         locale = request.data.get("locale") or settings.FRONTEND_DEFAULT_LOCALE
-        token = PasswordResetTokenGenerator().make_token(user)
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
-        reset_url = f"{settings.FRONTEND_BASE_URL}/{locale}/reset-password?uid={uid}&token={token}"
+        payload = {"detail": "Admin added."}
         if user.email and created_user:
-            email_sent, email_error = send_club_admin_welcome_email(user, club, reset_url)
-            if not email_sent:
-                return Response(
-                    {"detail": "email_send_failed", "error": email_error},
-                    status=status.HTTP_502_BAD_GATEWAY,
-                )
-        return Response({"detail": "Admin added."})
+            # The welcome email is delivered by the Celery worker after commit, so
+            # only "queued" (or a missing email configuration) is known here.
+            queued, email_error = send_club_admin_welcome_email(user, club, locale)
+            if queued:
+                payload["welcome_email"] = "queued"
+            else:
+                payload["welcome_email"] = "not_sent"
+                payload["error"] = email_error
+        return Response(payload)
 
     @action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
     def remove_admin(self, request, pk=None):
@@ -335,7 +340,7 @@ class ClubViewSet(OptionalPaginationListMixin, viewsets.ModelViewSet):
         ).order_by("usage_type", "-is_selected", "-created_at")
         if request.method == "GET":
             serializer = BrandingAssetSerializer(
-                queryset,
+                queryset.only(*BrandingAssetSerializer.queryset_fields),
                 many=True,
                 context={"request": request},
             )
@@ -455,7 +460,7 @@ class ClubViewSet(OptionalPaginationListMixin, viewsets.ModelViewSet):
 
 
 class FederationProfileView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsLtfFinanceOrLtfAdmin]
+    permission_classes = [IsLtfFinanceOrLtfAdmin]
 
     def _get_profile(self) -> FederationProfile:
         profile, _ = FederationProfile.objects.get_or_create(
@@ -481,7 +486,7 @@ class FederationProfileView(APIView):
 
 
 class FederationProfileLogoListView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsLtfFinanceOrLtfAdmin]
+    permission_classes = [IsLtfFinanceOrLtfAdmin]
     parser_classes = [MultiPartParser, FormParser]
 
     def _get_profile(self) -> FederationProfile:
@@ -499,7 +504,7 @@ class FederationProfileLogoListView(APIView):
             asset_type=BrandingAsset.AssetType.LOGO,
         ).order_by("usage_type", "-is_selected", "-created_at")
         serializer = BrandingAssetSerializer(
-            queryset,
+            queryset.only(*BrandingAssetSerializer.queryset_fields),
             many=True,
             context={"request": request},
         )
@@ -549,7 +554,7 @@ class FederationProfileLogoListView(APIView):
 
 
 class FederationProfileLogoDetailView(APIView):
-    permission_classes = [permissions.IsAuthenticated, IsLtfFinanceOrLtfAdmin]
+    permission_classes = [IsLtfFinanceOrLtfAdmin]
 
     def _get_logo(self, logo_id: int | str) -> BrandingAsset | None:
         return BrandingAsset.objects.filter(
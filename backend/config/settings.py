@@ -6,6 +6,7 @@ import base64
 import hashlib
 import json
 import re
+import sys
 from pathlib import Path
 
 from celery.schedules import crontab
@@ -197,6 +198,12 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Test fixtures hash a password for almost every user they create, and the
+# default PBKDF2 work factor dominated the suite's runtime. MD5 is only used
+# under `manage.py test`; deployed settings keep Django's default hashers.
+if sys.argv[1:2] == ["test"]:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 LANGUAGE_CODE = "en"
 LANGUAGES = [
     ("en", "English"),
@@ -309,7 +316,7 @@ ACCOUNT_ADAPTER = "accounts.adapter.CustomAccountAdapter"
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "accounts.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -320,10 +327,15 @@ REST_FRAMEWORK = {
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
         "rest_framework.throttling.UserRateThrottle",
+        "rest_framework.throttling.ScopedRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": config("DRF_ANON_THROTTLE_RATE", default="100/hour"),
         "user": config("DRF_USER_THROTTLE_RATE", default="6000/hour"),
+        # Per-view scopes for the unauthenticated, hashing- or email-heavy auth endpoints.
+        "login": config("DRF_LOGIN_THROTTLE_RATE", default="10/minute"),
+        "password_reset": config("DRF_PASSWORD_RESET_THROTTLE_RATE", default="5/minute"),
+        "email_verification": config("DRF_EMAIL_VERIFICATION_THROTTLE_RATE", default="10/minute"),
     },
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
@@ -342,6 +354,30 @@ DASHBOARD_OVERVIEW_CACHE_TTL_SECONDS = config(
     cast=int,
     default=20,
 )
+# Off without a shared cache: the invalidation on user save would only clear
+# the worker that handled the change.
+ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS = config(
+    "ACCOUNT_USER_PAYLOAD_CACHE_TTL_SECONDS",
+    cast=int,
+    default=60 if DJANGO_CACHE_URL else 0,
+)
+ACCOUNT_ME_BROWSER_CACHE_MAX_AGE_SECONDS = config(
+    "ACCOUNT_ME_BROWSER_CACHE_MAX_AGE_SECONDS",
+    cast=int,
+    default=0,
+)
+# Invalidation only reaches other Gunicorn workers through a shared cache, so
+# without DJANGO_CACHE_URL a logged-out token would keep working elsewhere.
+ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS = config(
+    "ACCOUNT_AUTH_TOKEN_CACHE_TTL_SECONDS",
+    cast=int,
+    default=300 if DJANGO_CACHE_URL else 0,
+)
+ACCOUNT_EMAIL_VERIFY_CACHE_TTL_SECONDS = config(
+    "ACCOUNT_EMAIL_VERIFY_CACHE_TTL_SECONDS",
+    cast=int,
+    default=60,
+)
 
 
 SPECTACULAR_SETTINGS = {
@@ -413,6 +449,10 @@ CELERY_PRINT_JOB_TIME_LIMIT_SECONDS = max(
     CELERY_PRINT_JOB_SOFT_TIME_LIMIT_SECONDS + 1,
     config("CELERY_PRINT_JOB_TIME_LIMIT_SECONDS", cast=int, default=360),
 )
+CELERY_EMAIL_TASK_MAX_RETRIES = max(
+    0,
+    config("CELERY_EMAIL_TASK_MAX_RETRIES", cast=int, default=5),
+)
 CELERY_RECONCILE_EXPIRED_LICENSES_HOUR = config(
     "CELERY_RECONCILE_EXPIRED_LICENSES_HOUR",
     cast=int,
@@ -0,0 +1,13 @@
+import tempfile
+
+from django.test import override_settings
+
+
+class TemporaryMediaRootMixin:
+    """Write uploads from every test in the class to a temporary MEDIA_ROOT."""
+
+    @classmethod
+    def setUpClass(cls):
+        media_root = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+        super().setUpClass()
@@ -1,5 +1,6 @@
 import csv
 from io import TextIOWrapper
+from itertools import islice
 
 
 MAX_ROWS = 5000
@@ -9,11 +10,12 @@ def read_csv(file_obj):
     file_obj.seek(0)
     wrapper = TextIOWrapper(file_obj, encoding="utf-8-sig")
     reader = csv.reader(wrapper)
-    rows = list(reader)
+    # Stop decoding once the header and MAX_ROWS data rows have been read.
+    rows = list(islice(reader, MAX_ROWS + 1))
     if not rows:
         return [], []
     headers = [header.strip() for header in rows[0]]
-    data_rows = rows[1 : MAX_ROWS + 1]
+    data_rows = rows[1:]
     return headers, data_rows
 
 
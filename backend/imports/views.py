@@ -20,6 +20,8 @@ from .serializers import (
     ImportPreviewResponseSerializer,
 )
 
+CLUB_IMPORT_BATCH_SIZE = 500
+
 
 def parse_mapping(raw_mapping):
     if not raw_mapping:
@@ -257,32 +259,32 @@ class ClubImportConfirmView(views.APIView):
         if not name_header:
             return response.Response({"detail": "Mapping for name is required."}, status=400)
 
-        created = 0
         skipped = 0
         row_errors = []
+        clubs_to_create = []
 
-        with transaction.atomic():
-            for index, row in enumerate(rows, start=1):
-                action = actions.get(index, "create")
-                if action == "skip":
-                    skipped += 1
-                    continue
+        for index, row in enumerate(rows, start=1):
+            action = actions.get(index, "create")
+            if action == "skip":
+                skipped += 1
+                continue
 
-                row_data = to_row_dict(headers, row)
-                errors = []
-                name = row_data.get(name_header, "").strip()
-                if not name:
-                    errors.append("name is required")
+            row_data = to_row_dict(headers, row)
+            errors = []
+            name = row_data.get(name_header, "").strip()
+            if not name:
+                errors.append("name is required")
 
-                if errors:
-                    row_errors.append({"row_index": index, "errors": errors})
-                    continue
-                address_fields = parse_club_address_fields(row_data, mapping, errors)
-                if errors:
-                    row_errors.append({"row_index": index, "errors": errors})
-                    continue
+            if errors:
+                row_errors.append({"row_index": index, "errors": errors})
+                continue
+            address_fields = parse_club_address_fields(row_data, mapping, errors)
+            if errors:
+                row_errors.append({"row_index": index, "errors": errors})
+                continue
 
-                Club.objects.create(
+            clubs_to_create.append(
+                Club(
                     name=name,
                     city=address_fields["locality"],
                     address=address_fields["address_line1"],
@@ -294,10 +296,12 @@ class ClubImportConfirmView(views.APIView):
                     bank_name=address_fields["bank_name"],
                     created_by=request.user,
                 )
-                created += 1
+            )
+
+        Club.objects.bulk_create(clubs_to_create, batch_size=CLUB_IMPORT_BATCH_SIZE)
 
         return response.Response(
-            {"created": created, "skipped": skipped, "errors": row_errors}
+            {"created": len(clubs_to_create), "skipped": skipped, "errors": row_errors}
         )
 
 
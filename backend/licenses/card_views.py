@@ -16,6 +16,7 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from accounts.permissions import IsLtfAdmin, IsLtfAdminOrClubAdmin
 from config.pagination import OptionalPaginationListMixin
 
 from clubs.models import Club
@@ -80,16 +81,6 @@ class IsLtfAdminOrClubAdminReadOnly(permissions.BasePermission):
         return bool(_is_club_admin(user) and request.method in permissions.SAFE_METHODS)
 
 
-class IsLtfAdminOrClubAdmin(permissions.BasePermission):
-    def has_permission(self, request, view):
-        return bool(_is_ltf_admin(request.user) or _is_club_admin(request.user))
-
-
-class IsLtfAdminOnly(permissions.BasePermission):
-    def has_permission(self, request, view):
-        return bool(_is_ltf_admin(request.user))
-
-
 class CardFormatPresetViewSet(viewsets.ModelViewSet):
     serializer_class = CardFormatPresetSerializer
     permission_classes = [IsLtfAdminOrClubAdminReadOnly]
@@ -631,7 +622,7 @@ class CardTemplateVersionViewSet(viewsets.ModelViewSet):
 
 class CardFontAssetViewSet(viewsets.ModelViewSet):
     serializer_class = CardFontAssetSerializer
-    permission_classes = [IsLtfAdminOnly]
+    permission_classes = [IsLtfAdmin]
     queryset = CardFontAsset.objects.all()
 
     def get_queryset(self):
@@ -645,7 +636,7 @@ class CardFontAssetViewSet(viewsets.ModelViewSet):
 
 class CardImageAssetViewSet(viewsets.ModelViewSet):
     serializer_class = CardImageAssetSerializer
-    permission_classes = [IsLtfAdminOnly]
+    permission_classes = [IsLtfAdmin]
     queryset = CardImageAsset.objects.all()
 
     def get_queryset(self):
@@ -11,7 +11,7 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 import stripe
 
-from accounts.email_utils import send_resend_email
+from accounts.email_utils import send_bulk_resend_email
 
 from .history import expire_outdated_licenses, log_license_status_change
 from .models import FinanceAuditLog, Invoice, License, Order, PrintJob
@@ -320,14 +320,17 @@ def send_invoice_email(invoice_id: int, recipients: list[str] | None = None) ->
         "filename": f"invoice_{invoice.invoice_number}.pdf",
         "content": base64.b64encode(pdf_bytes).decode("ascii"),
     }
-    for recipient in recipient_list:
-        success, error = send_resend_email(
-            recipient,
-            f"Invoice {invoice.invoice_number}",
-            html,
-            text,
-            attachments=[attachment],
-        )
+    results = send_bulk_resend_email(
+        {
+            "to_email": recipient,
+            "subject": f"Invoice {invoice.invoice_number}",
+            "html": html,
+            "text": text,
+            "attachments": [attachment],
+        }
+        for recipient in recipient_list
+    )
+    for recipient, (success, error) in zip(recipient_list, results):
         FinanceAuditLog.objects.create(
             action="invoice.email_sent" if success else "invoice.email_failed",
             message="Invoice email dispatched." if success else f"Invoice email failed: {error}",
@@ -16,6 +16,7 @@ from PIL import Image
 
 from accounts.models import User
 from clubs.models import Club
+from config.testing import TemporaryMediaRootMixin
 from members.models import Member
 
 from .models import (
@@ -1431,7 +1432,7 @@ class LicenseCardDesignerV2FoundationApiTests(TestCase):
         self.assertIn("secondary_license_role", keys)
 
 
-class LicenseCardPreviewApiTests(TestCase):
+class LicenseCardPreviewApiTests(TemporaryMediaRootMixin, TestCase):
     def setUp(self):
         self.client = APIClient()
         self.ltf_admin = User.objects.create_user(
@@ -2630,7 +2631,7 @@ class LicenseCardPreviewApiTests(TestCase):
 
 
 @override_settings(CELERY_TASK_ALWAYS_EAGER=True, CELERY_TASK_EAGER_PROPAGATES=True)
-class PrintJobExecutionPipelineTests(TestCase):
+class PrintJobExecutionPipelineTests(TemporaryMediaRootMixin, TestCase):
     def setUp(self):
         self.client = APIClient()
         self.ltf_admin = User.objects.create_user(
@@ -17,6 +17,7 @@ class MemberAdmin(admin.ModelAdmin):
         "photo_consent_attested_at",
     )
     list_filter = ("sex", "primary_license_role", "secondary_license_role", "is_active", "club")
+    list_select_related = ("club",)
     search_fields = ("first_name", "last_name")
     readonly_fields = ("photo_consent_attested_at", "photo_consent_attested_by")
 
@@ -29,6 +30,7 @@ class MemberAdmin(admin.ModelAdmin):
 class GradePromotionHistoryAdmin(admin.ModelAdmin):
     list_display = ("member", "from_grade", "to_grade", "promotion_date", "club")
     list_filter = ("promotion_date", "club")
+    list_select_related = ("member", "club")
     search_fields = ("member__first_name", "member__last_name", "from_grade", "to_grade")
     readonly_fields = (
         "member",